@@ -15,25 +15,99 @@ Usage:
 
 import os
 import sys
+import atexit
+import contextlib
+import signal
 import argparse
+import mmap
 import zipfile
 import shutil
+import threading
+import subprocess
+from uuid import uuid4
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# Set development environment
-os.environ.setdefault('FLOW_PLAYER_DEV', '1')
-
-# Override paths for development
-os.environ.setdefault('FLOW_PLAYER_BASE_PATH', str(project_root))
-os.environ.setdefault('FLOW_PLAYER_SHOWS_PATH', str(project_root / 'shows'))
-os.environ.setdefault('FLOW_PLAYER_CONFIG_PATH', str(project_root / 'config'))
-os.environ.setdefault('FLOW_PLAYER_LOGS_PATH', str(project_root / 'logs'))
+# Development environment and path overrides (exported for child
+# processes such as the reloader; existing values are kept)
+_DEV_ENV_DEFAULTS = (
+    ('FLOW_PLAYER_DEV', '1'),
+    ('FLOW_PLAYER_BASE_PATH', str(project_root)),
+    ('FLOW_PLAYER_SHOWS_PATH', str(project_root / 'shows')),
+    ('FLOW_PLAYER_CONFIG_PATH', str(project_root / 'config')),
+    ('FLOW_PLAYER_LOGS_PATH', str(project_root / 'logs')),
+)
+for _key, _value in _DEV_ENV_DEFAULTS:
+    if _key not in os.environ:
+        os.environ[_key] = _value
 
 import logging
+import logging.handlers
+
+# Copy buffer for zip extraction (zipfile.extractall uses 16 KiB)
+ZIP_COPY_BUFFER = 1 << 20
+# Members up to this size are read into one preallocated buffer
+ZIP_SMALL_MEMBER = 16 * 1024 * 1024
+
+# Log file write buffer and rotation
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# Set once setup_logging() has installed the root handlers
+_logging_configured = False
+
+
+class BufferedFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that buffers records and only flushes on WARNING+
+
+    logging.FileHandler flushes after every record, i.e. one write() syscall
+    per log line. Here records accumulate in a 64 KiB buffer and reach the
+    disk when it fills, on WARNING or above, or on shutdown.
+
+    The file size is tracked locally: RotatingFileHandler.shouldRollover
+    calls tell(), which would flush the buffer on every record.
+    """
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None,
+                 delay=False, buffer_size: int = LOG_BUFFER_SIZE,
+                 flush_level: int = logging.WARNING):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self._size = 0
+        super().__init__(filename, mode=mode, maxBytes=maxBytes, backupCount=backupCount,
+                         encoding=encoding, delay=delay)
+
+    def _open(self):
+        stream = open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                      encoding=self.encoding, errors=self.errors)
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            # Size in bytes as written: non-ASCII text takes more than one
+            # byte per character
+            size = len(msg.encode(self.stream.encoding, self.stream.errors))
+            if self.maxBytes > 0 and self._size and self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._size += size
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logging(log_level: str = "INFO"):
@@ -42,6 +116,10 @@ def setup_logging(log_level: str = "INFO"):
     Args:
         log_level: DEBUG, INFO, WARNING, ERROR (default INFO for dev)
     """
+    global _logging_configured
+    if _logging_configured:
+        return logging.getLogger(__name__)
+
     log_dir = project_root / 'logs'
     log_dir.mkdir(exist_ok=True)
     log_file = log_dir / 'flow-player.log'
@@ -52,19 +130,35 @@ def setup_logging(log_level: str = "INFO"):
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
 
-    file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+    # delay=True: the file is only opened once something is logged to it
+    file_handler = BufferedFileHandler(log_file, mode='a', encoding='utf-8',
+                                       maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT,
+                                       delay=True)
     file_handler.setLevel(level)
 
+    # Make sure buffered records reach the disk on exit and on SIGTERM
+    atexit.register(file_handler.flush)
+
+    def handle_sigterm(signum, frame):
+        file_handler.flush()
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
     # Create formatter
     formatter = logging.Formatter('%(asctime)s %(levelname)s [%(name)s] %(message)s')
     console_handler.setFormatter(formatter)
     file_handler.setFormatter(formatter)
 
-    # Setup root logger
-    logging.basicConfig(
-        level=level,
-        handlers=[console_handler, file_handler]
-    )
+    # Setup root logger, replacing any handlers installed before us so
+    # every record is emitted exactly once per handler
+    root = logging.getLogger()
+    root.setLevel(level)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(console_handler)
+    root.addHandler(file_handler)
+    _logging_configured = True
 
     # Reduce noise from libraries
     logging.getLogger('werkzeug').setLevel(logging.WARNING)
@@ -73,6 +167,111 @@ def setup_logging(log_level: str = "INFO"):
     return logging.getLogger(__name__)
 
 
+class _MappedArchive(mmap.mmap):
+    """Read-only mmap usable as a zipfile source (mmap.seekable is 3.13+)"""
+
+    def seekable(self):
+        return True
+
+
+def _map_archive(fh):
+    """Memory-map an open archive read-only (plain file object if empty)"""
+    if os.fstat(fh.fileno()).st_size == 0:
+        # mmap refuses zero-length files; let zipfile report the bad archive
+        return contextlib.nullcontext(fh)
+    return _MappedArchive(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def extract_zip(zip_path: Path, extract_path: Path, unzip_bin: str = None):
+    """Extract a zip archive
+
+    Uses the native unzip tool when available (about 2x faster inflate than
+    Python's zipfile). Otherwise falls back to a zipfile loop with 1 MiB copy
+    buffers instead of extractall's 16 KiB ones. Member names are sanitized
+    the same way extractall does (no absolute paths, no '..' components).
+    The archive is memory-mapped so zipfile reads it without per-read syscalls.
+    """
+    if unzip_bin:
+        extract_path.mkdir(parents=True, exist_ok=True)
+        subprocess.run(
+            [unzip_bin, '-q', '-o', str(zip_path), '-d', str(extract_path)],
+            check=True
+        )
+        return
+
+    root = str(extract_path)
+    # Directories already created; members usually share a few parents
+    seen_dirs = set()
+
+    with open(zip_path, 'rb') as fh, _map_archive(fh) as archive, \
+            zipfile.ZipFile(archive, 'r') as zf:
+        for zi in zf.infolist():
+            parts = [p for p in zi.filename.replace('\\', '/').split('/')
+                     if p not in ('', '.', '..')]
+            if not parts:
+                continue
+            dest = os.path.join(root, *parts)
+
+            if zi.is_dir():
+                if dest not in seen_dirs:
+                    os.makedirs(dest, exist_ok=True)
+                    seen_dirs.add(dest)
+                continue
+
+            parent = os.path.dirname(dest)
+            if parent not in seen_dirs:
+                os.makedirs(parent, exist_ok=True)
+                seen_dirs.add(parent)
+
+            # Empty files: nothing to copy
+            if zi.file_size == 0:
+                open(dest, 'wb').close()
+                continue
+
+            if zi.file_size <= ZIP_SMALL_MEMBER:
+                # Decompress into a buffer sized exactly once, write it in one call
+                buf = bytearray(zi.file_size)
+                view = memoryview(buf)
+                pos = 0
+                with zf.open(zi) as src:
+                    while pos < zi.file_size:
+                        n = src.readinto(view[pos:])
+                        if not n:
+                            break
+                        pos += n
+                with open(dest, 'wb', buffering=0) as dst:
+                    dst.write(view[:pos])
+                continue
+
+            buffering = min(zi.file_size, ZIP_COPY_BUFFER)
+            with zf.open(zi) as src, open(dest, 'wb', buffering=buffering) as dst:
+                shutil.copyfileobj(src, dst, ZIP_COPY_BUFFER)
+
+
+def _rmtree_async(path: Path):
+    """Delete a directory tree in a daemon thread"""
+    threading.Thread(target=shutil.rmtree, args=(path,),
+                     kwargs={'ignore_errors': True}, daemon=True).start()
+
+
+def remove_tree_in_background(path: Path, trash_parent: Path):
+    """Move a directory out of the way and delete it in the background
+
+    The rename is a single syscall; the per-file unlinks of rmtree then run
+    off the startup path. Leftovers from an interrupted delete are swept by
+    sweep_trash() on the next start.
+    """
+    trash = trash_parent / f'.trash-{uuid4().hex}'
+    os.rename(path, trash)
+    _rmtree_async(trash)
+
+
+def sweep_trash(shows_path: Path):
+    """Delete trash directories left over from a previous run"""
+    for trash in shows_path.glob('.trash-*'):
+        _rmtree_async(trash)
+
+
 def import_zip_shows(logger):
     """Import any zip files from datas/ folder to shows/"""
     datas_path = project_root / 'datas'
@@ -83,12 +282,19 @@ def import_zip_shows(logger):
         return
 
     shows_path.mkdir(exist_ok=True)
+    sweep_trash(shows_path)
 
-    zip_files = list(datas_path.glob('*.zip'))
+    # DirEntry.is_file() uses the d_type from readdir, no extra stat()
+    with os.scandir(datas_path) as it:
+        zip_files = [Path(e.path) for e in it if e.name.endswith('.zip') and e.is_file()]
     if not zip_files:
         logger.info("No zip files found in datas/")
         return
 
+    unzip_bin = shutil.which('unzip')
+
+    # Collect work items; skipping and cleanup stay on the calling thread
+    pending = []
     for zip_path in zip_files:
         folder_name = zip_path.stem
         extract_path = shows_path / folder_name
@@ -100,20 +306,46 @@ def import_zip_shows(logger):
 
         # Remove incomplete extraction
         if extract_path.exists():
-            shutil.rmtree(extract_path)
+            remove_tree_in_background(extract_path, shows_path)
 
-        logger.info(f"Extracting {zip_path.name} to shows/{folder_name}")
-        try:
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                zf.extractall(extract_path)
+        pending.append((zip_path, extract_path))
 
-            # Verify project.json exists
-            if (extract_path / 'project.json').exists():
-                logger.info(f"Successfully imported: {folder_name}")
-            else:
-                logger.warning(f"No project.json found in {folder_name}")
-        except Exception as e:
-            logger.error(f"Failed to extract {zip_path.name}: {e}")
+    if not pending:
+        return
+
+    def _extract_one(zip_path: Path, extract_path: Path) -> bool:
+        logger.info(f"Extracting {zip_path.name} to shows/{extract_path.name}")
+        extract_zip(zip_path, extract_path, unzip_bin)
+        return (extract_path / 'project.json').exists()
+
+    # Archives are independent and inflate releases the GIL
+    with ThreadPoolExecutor(max_workers=min(4, len(pending))) as executor:
+        futures = {
+            executor.submit(_extract_one, zip_path, extract_path): zip_path
+            for zip_path, extract_path in pending
+        }
+        for future in as_completed(futures):
+            zip_path = futures[future]
+            try:
+                # Verify project.json exists
+                if future.result():
+                    logger.info(f"Successfully imported: {zip_path.stem}")
+                else:
+                    logger.warning(f"No project.json found in {zip_path.stem}")
+            except Exception as e:
+                logger.error(f"Failed to extract {zip_path.name}: {e}")
+
+
+def get_reloader_type() -> str:
+    """Use the inotify-based watchdog reloader when available
+
+    Werkzeug's stat reloader polls every file on sys.path once per second.
+    """
+    try:
+        import watchdog  # noqa: F401
+        return 'watchdog'
+    except ImportError:
+        return 'stat'
 
 
 def check_mpv():
@@ -144,35 +376,27 @@ def main():
 
     logger = setup_logging(args.log_level)
 
-    logger.info("=" * 60)
-    logger.info("Flow Player - Development Mode (Ubuntu)")
-    logger.info("=" * 60)
+    logger.info("\n".join([
+        "=" * 60,
+        "Flow Player - Development Mode (Ubuntu)",
+        "=" * 60,
+    ]))
 
     # Import from local modules after logging is set up
+    # (FlowPlayer and its mpv/DMX backends are only imported when needed)
     from src.core.config import Config
-    from src.flow_player import FlowPlayer
     from src.web.app import create_app
 
     # Create directories
-    (project_root / 'shows').mkdir(exist_ok=True)
-    (project_root / 'config').mkdir(exist_ok=True)
-    (project_root / 'logs').mkdir(exist_ok=True)
+    shows_path = project_root / 'shows'
+    config_path = project_root / 'config'
+    logs_path = project_root / 'logs'
+    for path in (shows_path, config_path, logs_path):
+        path.mkdir(exist_ok=True)
 
     # Always import zip files from datas/
     import_zip_shows(logger)
 
-    # Check MPV availability
-    mpv_available = check_mpv()
-    if mpv_available:
-        logger.info("MPV is available - video playback will work")
-    else:
-        logger.warning("MPV not available - install with: pip install python-mpv")
-        logger.warning("Also install mpv: sudo apt install mpv libmpv-dev")
-
-    # Create config directory
-    config_path = project_root / 'config'
-    config_path.mkdir(exist_ok=True)
-
     # Load existing config or create new one
     config_file = config_path / 'config.json'
     if config_file.exists():
@@ -184,9 +408,9 @@ def main():
 
     # Override paths for development
     config.base_path = project_root
-    config.shows_path = project_root / 'shows'
+    config.shows_path = shows_path
     config.config_path = config_path
-    config.logs_path = project_root / 'logs'
+    config.logs_path = logs_path
     config._config_file = config_file
     config._state_file = config_path / 'state.json'
 
@@ -205,7 +429,16 @@ def main():
     player = None
 
     if not args.web_only:
+        # Check MPV availability
+        if check_mpv():
+            logger.info("MPV is available - video playback will work")
+        else:
+            logger.warning("MPV not available - install with: pip install python-mpv")
+            logger.warning("Also install mpv: sudo apt install mpv libmpv-dev")
+
         try:
+            from src.flow_player import FlowPlayer
+
             logger.info("Initializing Flow Player...")
             player = FlowPlayer(config)
             player.initialize()
@@ -214,9 +447,10 @@ def main():
             # List available shows
             shows = player.list_shows()
             if shows:
-                logger.info(f"Available shows: {len(shows)}")
-                for show in shows:
-                    logger.info(f"  - {show.get('name', 'Unknown')} ({show.get('id', '?')})")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Available shows: %d", len(shows))
+                    for show in shows:
+                        logger.info("  - %s (%s)", show.get('name', 'Unknown'), show.get('id', '?'))
             else:
                 logger.warning("No shows found in shows/ folder")
                 logger.info("Place Flow Studio exports (.zip) in the datas/ folder")
@@ -230,23 +464,29 @@ def main():
     # Create and run Flask app
     app = create_app(player)
 
-    logger.info("")
-    logger.info("=" * 60)
-    logger.info(f"Web interface: http://{args.host}:{args.port}")
-    logger.info("=" * 60)
-    logger.info("")
-    logger.info("Tips:")
-    logger.info("  - Place Flow Studio exports (.zip) in datas/ folder")
-    logger.info("  - Use Ctrl+C to stop the server")
-    logger.info("  - Access /api/status for player status JSON")
-    logger.info("")
+    # One record per block: a single format/write and no interleaving
+    logger.info("\n".join([
+        "",
+        "=" * 60,
+        f"Web interface: http://{args.host}:{args.port}",
+        "=" * 60,
+        "",
+        "Tips:",
+        "  - Place Flow Studio exports (.zip) in datas/ folder",
+        "  - Use Ctrl+C to stop the server",
+        "  - Access /api/status for player status JSON",
+        "",
+    ]))
 
     try:
         app.run(
             host=args.host,
             port=args.port,
             debug=True,
-            use_reloader=not args.no_reload
+            use_reloader=not args.no_reload,
+            reloader_type=get_reloader_type(),
+            # Media, logs and show archives never need a code reload
+            exclude_patterns=['*/shows/*', '*/logs/*', '*/datas/*']
         )
     except KeyboardInterrupt:
         logger.info("Shutting down...")
@@ -1,11 +1,12 @@
 """Configuration management for Flow Player"""
 
 import os
-import json
 import logging
 from pathlib import Path
 from typing import Any, Optional
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
+
+from .utils import json_loads, json_dumps_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -15,29 +16,78 @@ DEFAULT_SHOWS_PATH = DEFAULT_BASE_PATH / "shows"
 DEFAULT_CONFIG_PATH = DEFAULT_BASE_PATH / "config"
 DEFAULT_LOGS_PATH = DEFAULT_BASE_PATH / "logs"
 
+# Environment overrides: (env var, sub-config name or None, attribute, type)
+_ENV_OVERRIDES = (
+    ("FLOW_PLAYER_WEB_PORT", None, "web_port", int),
+    ("FLOW_PLAYER_WEB_HOST", None, "web_host", str),
+    ("FLOW_PLAYER_DMX_MODE", "dmx", "mode", str),
+    ("FLOW_PLAYER_DMX_IP", "dmx", "ip", str),
+    ("FLOW_PLAYER_DMX_UNIVERSE", "dmx", "universe", int),
+    ("FLOW_PLAYER_LOG_LEVEL", None, "log_level", str),
+)
+
+# Sub-config sections, in serialization order
+CONFIG_SECTIONS = ("network", "video", "audio", "dmx", "monitoring")
+
+
+def atomic_write_bytes(path: Path, payload: bytes):
+    """Write a file in a single write() and atomically replace the target
+
+    The payload goes to a sibling temp file that is then renamed over the
+    target, so readers never see a partially written file.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+class ConfigSection:
+    """Base class for config sections
+
+    Notifies the owning Config when a field changes so it can cache its
+    serialized form between changes.
+    """
+
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        owner = self.__dict__.get("_owner")
+        if owner is not None:
+            owner._invalidate()
+
+    def to_dict(self) -> dict:
+        """Shallow dict of the section fields
+
+        Sections are flat, so a one-level copy of vars() matches asdict()
+        without its recursive walk.
+        """
+        values = dict(vars(self))
+        values.pop("_owner", None)
+        return values
+
 
 @dataclass
-class NetworkConfig:
+class NetworkConfig(ConfigSection):
     hostname: str = "flowplayer-01"
     dhcp: bool = True
     static_ip: Optional[str] = None
 
 
 @dataclass
-class VideoConfig:
+class VideoConfig(ConfigSection):
     output: str = "HDMI-1"
     resolution: str = "1920x1080"
     refresh_rate: int = 60
 
 
 @dataclass
-class AudioConfig:
+class AudioConfig(ConfigSection):
     output: str = "hdmi"  # hdmi, jack, auto
     volume: int = 100
 
 
 @dataclass
-class DMXConfig:
+class DMXConfig(ConfigSection):
     mode: str = "artnet"  # artnet, sacn, usb
     enabled: bool = True
     # Art-Net settings
@@ -55,7 +105,7 @@ class DMXConfig:
 
 
 @dataclass
-class MonitoringConfig:
+class MonitoringConfig(ConfigSection):
     heartbeat_enabled: bool = False
     heartbeat_url: str = ""
     heartbeat_interval_sec: int = 30
@@ -99,6 +149,29 @@ class Config:
     _config_file: Path = field(default=None, repr=False)
     _state_file: Path = field(default=None, repr=False)
 
+    # Cached dicts of the sub-configs, rebuilt after any change
+    _sections_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if isinstance(value, ConfigSection):
+            object.__setattr__(value, "_owner", self)
+        if name not in ("_sections_cache", "_dirty"):
+            object.__setattr__(self, "_dirty", True)
+
+    def _invalidate(self):
+        """Mark the serialized sections cache as stale"""
+        object.__setattr__(self, "_dirty", True)
+
+    def _sections_dict(self) -> dict:
+        """Get the serialized sub-configs, cached until a field changes"""
+        if self._dirty or self._sections_cache is None:
+            cache = {name: getattr(self, name).to_dict() for name in CONFIG_SECTIONS}
+            object.__setattr__(self, "_sections_cache", cache)
+            object.__setattr__(self, "_dirty", False)
+        return self._sections_cache
+
     def __post_init__(self):
         """Initialize paths and load config file if exists"""
         if isinstance(self.base_path, str):
@@ -123,8 +196,7 @@ class Config:
 
         if config._config_file and config._config_file.exists():
             try:
-                with open(config._config_file, 'r') as f:
-                    data = json.load(f)
+                data = json_loads(config._config_file.read_bytes())
                 config._update_from_dict(data)
                 logger.info(f"Configuration loaded from {config._config_file}")
             except Exception as e:
@@ -157,41 +229,26 @@ class Config:
 
     def _load_env_overrides(self):
         """Load configuration overrides from environment variables"""
-        # FLOW_PLAYER_WEB_PORT, FLOW_PLAYER_DMX_MODE, etc.
-        prefix = "FLOW_PLAYER_"
-
-        env_mappings = {
-            f"{prefix}WEB_PORT": ("web_port", int),
-            f"{prefix}WEB_HOST": ("web_host", str),
-            f"{prefix}DMX_MODE": ("dmx.mode", str),
-            f"{prefix}DMX_IP": ("dmx.ip", str),
-            f"{prefix}DMX_UNIVERSE": ("dmx.universe", int),
-            f"{prefix}LOG_LEVEL": ("log_level", str),
-        }
-
-        for env_var, (attr_path, type_fn) in env_mappings.items():
+        for env_var, obj_name, attr_name, type_fn in _ENV_OVERRIDES:
             value = os.environ.get(env_var)
             if value:
                 try:
-                    if "." in attr_path:
-                        obj_name, attr_name = attr_path.split(".")
-                        obj = getattr(self, obj_name)
-                        setattr(obj, attr_name, type_fn(value))
-                    else:
-                        setattr(self, attr_path, type_fn(value))
+                    target = getattr(self, obj_name) if obj_name else self
+                    setattr(target, attr_name, type_fn(value))
                 except Exception as e:
                     logger.warning(f"Error setting {env_var}: {e}")
 
     def save(self):
-        """Save configuration to file"""
+        """Save configuration to file
+
+        The write is skipped when config.json already holds exactly the
+        serialized config, which spares the SD card a rewrite on every
+        startup. A missing, truncated or corrupted file is always rewritten.
+        """
         self.config_path.mkdir(parents=True, exist_ok=True)
 
         data = {
-            "network": asdict(self.network),
-            "video": asdict(self.video),
-            "audio": asdict(self.audio),
-            "dmx": asdict(self.dmx),
-            "monitoring": asdict(self.monitoring),
+            **self._sections_dict(),
             "active_show_id": self.active_show_id,
             "active_scene_id": self.active_scene_id,
             "autoplay": self.autoplay,
@@ -200,8 +257,19 @@ class Config:
             "web_port": self.web_port,
         }
 
-        with open(self._config_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        payload = json_dumps_bytes(data, indent=True)
+
+        # Compare with what is actually on disk (a read is far cheaper than
+        # a flash write)
+        try:
+            unchanged = self._config_file.read_bytes() == payload
+        except OSError:
+            unchanged = False
+        if unchanged:
+            logger.debug("Configuration unchanged, not rewriting %s", self._config_file)
+            return
+
+        atomic_write_bytes(self._config_file, payload)
 
         logger.info(f"Configuration saved to {self._config_file}")
 
@@ -209,29 +277,24 @@ class Config:
         """Save runtime state to state file (for quick persistence)"""
         self.config_path.mkdir(parents=True, exist_ok=True)
 
-        with open(self._state_file, 'w') as f:
-            json.dump(state, f, indent=2)
+        atomic_write_bytes(self._state_file, json_dumps_bytes(state, indent=True))
 
-        logger.debug(f"State saved to {self._state_file}")
+        logger.debug("State saved to %s", self._state_file)
 
     def load_state(self) -> dict:
         """Load runtime state from state file"""
         if self._state_file and self._state_file.exists():
             try:
-                with open(self._state_file, 'r') as f:
-                    return json.load(f)
+                return json_loads(self._state_file.read_bytes())
             except Exception as e:
                 logger.warning(f"Error loading state: {e}")
         return {}
 
     def to_dict(self) -> dict:
         """Convert config to dictionary for API responses"""
+        sections = self._sections_dict()
         return {
-            "network": asdict(self.network),
-            "video": asdict(self.video),
-            "audio": asdict(self.audio),
-            "dmx": asdict(self.dmx),
-            "monitoring": asdict(self.monitoring),
+            **{name: dict(values) for name, values in sections.items()},
             "active_show_id": self.active_show_id,
             "autoplay": self.autoplay,
             "loop": self.loop,
@@ -4,16 +4,22 @@ Records incoming Art-Net DMX frames for later playback.
 Useful for capturing complex sequences from a lighting console.
 """
 
+import os
+import sys
 import json
+import mmap
 import time
 import socket
 import struct
+import selectors
 import threading
 import logging
+from array import array
+from bisect import bisect_right
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Callable
-from dataclasses import dataclass, field, asdict
+from typing import Optional, List, Dict, Any, Callable, Union
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
@@ -22,24 +28,53 @@ ARTNET_PORT = 6454
 ARTNET_HEADER = b'Art-Net\x00'
 ARTNET_OPCODE_DMX = 0x5000
 
+# Recording file format (v1 was plain JSON): magic + JSON header length
+RECORDING_MAGIC = b'DMXR'
+RECORDING_FORMAT = 2
+_RECORDING_PREFIX = struct.Struct('<4sI')
 
-@dataclass
+# Cached recording info for list_recordings, stored next to the recordings
+RECORDINGS_INDEX = "_index.json"
+
+# DMX universe size
+DMX_CHANNELS = 512
+
+# Receive buffer size (an ArtDmx packet is at most 530 bytes)
+ARTNET_RECV_SIZE = 1024
+
+# Max packets read per wakeup before checking _running again
+ARTNET_DRAIN_LIMIT = 64
+
+# Art-Net socket receive buffer, to absorb console bursts without drops
+ARTNET_RCVBUF = 4 * 1024 * 1024
+
+# Linux socket option (not exposed by the socket module on all versions)
+SO_BINDTODEVICE = getattr(socket, 'SO_BINDTODEVICE', 25)
+
+# Nice increment for a pinned listener thread (negative = higher priority)
+LISTENER_NICE = -5
+
+# Frames get_frame_at walks forward from its previous answer before bisecting
+FRAME_WALK_LIMIT = 4
+
+
+@dataclass(slots=True)
 class DMXFrame:
     """Single DMX frame with timestamp"""
     timestamp_ms: int  # Milliseconds from recording start
-    channels: List[int]  # 512 channel values (0-255)
+    channels: bytes  # 512 channel values (0-255), one byte each
 
     def to_dict(self) -> Dict:
         return {
             "t": self.timestamp_ms,
-            "d": self.channels
+            "d": list(self.channels)
         }
 
     @classmethod
     def from_dict(cls, data: Dict) -> "DMXFrame":
         return cls(
             timestamp_ms=data["t"],
-            channels=data["d"]
+            channels=bytes(data["d"])
         )
 
 
@@ -58,30 +93,62 @@ class DMXRecording:
     trim_start_ms: int = 0
     trim_end_ms: int = 0
 
-    # Frames data
-    frames: List[DMXFrame] = field(default_factory=list)
+    # Frames data, stored as structure of arrays: one int32 timestamp per
+    # frame, and the frames' 512 channel bytes back to back in one buffer
+    # (a bytearray, or a read-only memoryview of the file when loaded)
+    timestamps_ms: array = field(default_factory=lambda: array('i'), repr=False)
+    channel_data: Union[bytearray, memoryview] = field(default_factory=bytearray, repr=False)
 
     # File path (when loaded from file)
     file_path: Optional[Path] = None
 
+    # (time_ms, index) of the last get_frame_at lookup
+    _lookup_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if not self.recorded_at:
             self.recorded_at = datetime.utcnow().isoformat() + "Z"
         if self.trim_end_ms == 0 and self.duration_ms > 0:
             self.trim_end_ms = self.duration_ms
 
-    def add_frame(self, timestamp_ms: int, channels: List[int]):
+    @property
+    def frame_count(self) -> int:
+        """Number of recorded frames"""
+        return len(self.timestamps_ms)
+
+    def _append_frame(self, timestamp_ms: int, channels: bytes):
+        """Append a frame, padding or truncating it to 512 channels"""
+        if len(channels) != DMX_CHANNELS:
+            channels = bytes(channels[:DMX_CHANNELS]).ljust(DMX_CHANNELS, b'\x00')
+        if not isinstance(self.channel_data, bytearray):
+            # Memory-mapped from file: copy before growing it
+            self.channel_data = bytearray(self.channel_data)
+        self.timestamps_ms.append(timestamp_ms)
+        self.channel_data += channels
+
+    def add_frame(self, timestamp_ms: int, channels: bytes):
         """Add a frame to the recording"""
-        self.frames.append(DMXFrame(timestamp_ms, channels))
+        self._append_frame(timestamp_ms, channels)
         self.duration_ms = max(self.duration_ms, timestamp_ms)
         if self.trim_end_ms == 0:
             self.trim_end_ms = self.duration_ms
 
+    def get_channels(self, index: int) -> bytes:
+        """Get the 512 channel values of frame `index`"""
+        if index < 0:
+            index += len(self.timestamps_ms)
+        start = index * DMX_CHANNELS
+        return bytes(self.channel_data[start:start + DMX_CHANNELS])
+
+    def get_frame(self, index: int) -> DMXFrame:
+        """Get frame `index` as a DMXFrame"""
+        return DMXFrame(self.timestamps_ms[index], self.get_channels(index))
+
     def get_trimmed_frames(self) -> List[DMXFrame]:
         """Get frames within trim range"""
         return [
-            f for f in self.frames
-            if self.trim_start_ms <= f.timestamp_ms <= self.trim_end_ms
+            self.get_frame(i) for i, t in enumerate(self.timestamps_ms)
+            if self.trim_start_ms <= t <= self.trim_end_ms
         ]
 
     def get_frame_at(self, time_ms: int) -> Optional[DMXFrame]:
@@ -89,16 +156,37 @@ class DMXRecording:
         # Adjust for trim
         adjusted_time = time_ms + self.trim_start_ms
 
-        # Find the frame at or just before this time
-        result = None
-        for frame in self.frames:
-            if frame.timestamp_ms <= adjusted_time:
-                result = frame
+        index = self._frame_index_at(adjusted_time)
+        if index < 0:
+            return None
+        return self.get_frame(index)
+
+    def _frame_index_at(self, time_ms: int) -> int:
+        """Index of the frame at or just before time_ms (-1 if none)
+
+        Playback asks for increasing times, so walk forward a few frames from
+        the previous answer first and only binary search on a miss or a seek.
+        """
+        timestamps = self.timestamps_ms
+        cache = self._lookup_cache
+        if cache is not None and cache[0] <= time_ms:
+            index = cache[1]
+            count = len(timestamps)
+            for _ in range(FRAME_WALK_LIMIT):
+                if index + 1 < count and timestamps[index + 1] <= time_ms:
+                    index += 1
+                else:
+                    break
             else:
-                break
-        return result
+                index = bisect_right(timestamps, time_ms) - 1
+        else:
+            index = bisect_right(timestamps, time_ms) - 1
+
+        # Single assignment so concurrent readers never see a mixed pair
+        self._lookup_cache = (time_ms, index)
+        return index
 
-    def get_frame_at_time(self, time_ms: int) -> Optional[List[int]]:
+    def get_frame_at_time(self, time_ms: int) -> Optional[bytes]:
         """Get channel values at the given time (respecting trim)
 
         This method is optimized for use by ScenePlayer for DMX sync.
@@ -107,14 +195,14 @@ class DMXRecording:
             time_ms: Time in milliseconds from playback start
 
         Returns:
-            List of 512 channel values, or None if no frame available
+            512 channel values as bytes, or None if no frame available
         """
         # Check if past end of recording
         trimmed_duration = self.get_trimmed_duration()
         if time_ms > trimmed_duration:
             # Return last frame
-            if self.frames:
-                return self.frames[-1].channels
+            if self.timestamps_ms:
+                return self.get_channels(-1)
             return None
 
         frame = self.get_frame_at(time_ms)
@@ -126,28 +214,63 @@ class DMXRecording:
         """Get duration considering trim points"""
         return self.trim_end_ms - self.trim_start_ms
 
+    def _meta_dict(self) -> Dict:
+        """Recording metadata as stored in the file (everything but frames)"""
+        return {
+            "version": self.version,
+            "name": self.name,
+            "recorded_at": self.recorded_at,
+            "duration_ms": self.duration_ms,
+            "fps": self.fps,
+            "universe": self.universe,
+            "source_ip": self.source_ip,
+            "trim_start_ms": self.trim_start_ms,
+            "trim_end_ms": self.trim_end_ms,
+        }
+
+    @classmethod
+    def _from_meta(cls, data: Dict, path: Path) -> "DMXRecording":
+        """Create a recording (without frames) from file metadata"""
+        return cls(
+            name=data.get("name", path.stem),
+            version=data.get("version", "1.0"),
+            recorded_at=data.get("recorded_at", ""),
+            duration_ms=data.get("duration_ms", 0),
+            fps=data.get("fps", 40),
+            universe=data.get("universe", 0),
+            source_ip=data.get("source_ip", ""),
+            trim_start_ms=data.get("trim_start_ms", 0),
+            trim_end_ms=data.get("trim_end_ms", 0),
+        )
+
     def save(self, path: Path) -> bool:
-        """Save recording to file"""
+        """Save recording to file (binary format v2)
+
+        Layout: magic, header length, JSON header, then the int32
+        little-endian timestamps and the 512-byte channel rows.
+        """
         try:
-            data = {
-                "version": self.version,
-                "name": self.name,
-                "recorded_at": self.recorded_at,
-                "duration_ms": self.duration_ms,
-                "fps": self.fps,
-                "universe": self.universe,
-                "source_ip": self.source_ip,
-                "trim_start_ms": self.trim_start_ms,
-                "trim_end_ms": self.trim_end_ms,
-                "frames": [f.to_dict() for f in self.frames]
-            }
+            header = self._meta_dict()
+            header["format"] = RECORDING_FORMAT
+            header["frame_count"] = self.frame_count
+            header_bytes = json.dumps(header).encode('utf-8')
+
+            timestamps = self.timestamps_ms
+            if sys.byteorder == 'big':
+                timestamps = array('i', timestamps)
+                timestamps.byteswap()
 
             path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, 'w') as f:
-                json.dump(data, f)
+            tmp_path = path.with_name(path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(_RECORDING_PREFIX.pack(RECORDING_MAGIC, len(header_bytes)))
+                f.write(header_bytes)
+                f.write(timestamps.tobytes())
+                f.write(self.channel_data)
+            os.replace(tmp_path, path)
 
             self.file_path = path
-            logger.info(f"Recording saved to {path} ({len(self.frames)} frames)")
+            logger.info(f"Recording saved to {path} ({self.frame_count} frames)")
             return True
         except Exception as e:
             logger.error(f"Failed to save recording: {e}")
@@ -155,34 +278,86 @@ class DMXRecording:
 
     @classmethod
     def load(cls, path: Path) -> Optional["DMXRecording"]:
-        """Load recording from file"""
+        """Load recording from file (binary v2 or legacy JSON v1)"""
         try:
-            with open(path, 'r') as f:
-                data = json.load(f)
-
-            recording = cls(
-                name=data.get("name", path.stem),
-                version=data.get("version", "1.0"),
-                recorded_at=data.get("recorded_at", ""),
-                duration_ms=data.get("duration_ms", 0),
-                fps=data.get("fps", 40),
-                universe=data.get("universe", 0),
-                source_ip=data.get("source_ip", ""),
-                trim_start_ms=data.get("trim_start_ms", 0),
-                trim_end_ms=data.get("trim_end_ms", 0),
-            )
-
-            # Load frames
-            for frame_data in data.get("frames", []):
-                recording.frames.append(DMXFrame.from_dict(frame_data))
+            with open(path, 'rb') as f:
+                prefix = f.read(_RECORDING_PREFIX.size)
+                if prefix[:len(RECORDING_MAGIC)] == RECORDING_MAGIC:
+                    recording = cls._read_binary(f, prefix, path)
+                else:
+                    recording = cls._read_json(prefix + f.read(), path)
 
             recording.file_path = path
-            logger.info(f"Recording loaded from {path} ({len(recording.frames)} frames)")
+            logger.info(f"Recording loaded from {path} ({recording.frame_count} frames)")
             return recording
         except Exception as e:
             logger.error(f"Failed to load recording from {path}: {e}")
             return None
 
+    @classmethod
+    def load_info(cls, path: Path) -> Optional[Dict]:
+        """Load only the recording info (as to_info_dict), not the frames
+
+        Binary recordings only need their header read; legacy JSON
+        recordings still have to be parsed in full.
+        """
+        try:
+            with open(path, 'rb') as f:
+                prefix = f.read(_RECORDING_PREFIX.size)
+                if prefix[:len(RECORDING_MAGIC)] == RECORDING_MAGIC:
+                    _, header_size = _RECORDING_PREFIX.unpack(prefix)
+                    header = json.loads(f.read(header_size))
+                else:
+                    header = None
+
+            if header is None:
+                recording = cls.load(path)
+                return recording.to_info_dict() if recording else None
+
+            recording = cls._from_meta(header, path)
+            recording.file_path = path
+            info = recording.to_info_dict()
+            info["frame_count"] = header.get("frame_count", 0)
+            return info
+        except Exception as e:
+            logger.error(f"Failed to load recording info from {path}: {e}")
+            return None
+
+    @classmethod
+    def _read_binary(cls, f, prefix: bytes, path: Path) -> "DMXRecording":
+        """Read a v2 recording; `prefix` holds the magic and header length"""
+        _, header_size = _RECORDING_PREFIX.unpack(prefix)
+        header = json.loads(f.read(header_size))
+        recording = cls._from_meta(header, path)
+        count = header.get("frame_count", 0)
+
+        timestamps = array('i')
+        timestamps.frombytes(f.read(count * timestamps.itemsize))
+        channels_start = f.tell()
+        channels_size = count * DMX_CHANNELS
+        if len(timestamps) != count or os.fstat(f.fileno()).st_size < channels_start + channels_size:
+            raise ValueError("truncated recording file")
+        if sys.byteorder == 'big':
+            timestamps.byteswap()
+
+        recording.timestamps_ms = timestamps
+        if channels_size:
+            # Map the channel rows instead of reading them: the OS pages in
+            # only the frames playback touches. The view keeps the map alive,
+            # and save() replaces the file rather than rewriting it in place.
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            recording.channel_data = memoryview(mapped)[channels_start:channels_start + channels_size]
+        return recording
+
+    @classmethod
+    def _read_json(cls, raw: bytes, path: Path) -> "DMXRecording":
+        """Read a legacy v1 (JSON) recording"""
+        data = json.loads(raw)
+        recording = cls._from_meta(data, path)
+        for frame_data in data.get("frames", []):
+            recording._append_frame(frame_data["t"], bytes(frame_data["d"]))
+        return recording
+
     def to_info_dict(self) -> Dict:
         """Get recording info (without frames data)"""
         return {
@@ -195,7 +370,7 @@ class DMXRecording:
             "source_ip": self.source_ip,
             "trim_start_ms": self.trim_start_ms,
             "trim_end_ms": self.trim_end_ms,
-            "frame_count": len(self.frames),
+            "frame_count": self.frame_count,
             "file_path": str(self.file_path) if self.file_path else None
         }
 
@@ -224,27 +399,52 @@ class DMXRecorder:
         # Recording state
         self._recording = False
         self._current_recording: Optional[DMXRecording] = None
-        self._record_start_time: float = 0
+        self._record_start_ns: int = 0
         self._record_universe: int = 0
+        self._last_recorded: Optional[bytes] = None  # Channels of the last stored frame
 
         # Callbacks
-        self._on_frame_callback: Optional[Callable[[DMXFrame], None]] = None
+        self._on_channels_callback: Optional[Callable[[int, bytes], None]] = None
         self._on_recording_complete: Optional[Callable[[DMXRecording], None]] = None
 
         # Stats
         self._frames_received = 0
-        self._last_frame_time: float = 0
+        self._last_frame_ns: int = 0
 
-    def set_on_frame(self, callback: Callable[[DMXFrame], None]):
-        """Set callback for each received frame (for live preview)"""
-        self._on_frame_callback = callback
+    def set_on_channels(self, callback: Optional[Callable[[int, bytes], None]]):
+        """Set callback for each received frame (for live preview)
+
+        Called with (timestamp_ms, channels), without building a DMXFrame.
+        """
+        self._on_channels_callback = callback
+
+    def set_on_frame(self, callback: Optional[Callable[[DMXFrame], None]]):
+        """Set callback for each received frame as a DMXFrame
+
+        Kept for compatibility: allocates a DMXFrame per packet, prefer
+        set_on_channels.
+        """
+        if callback is None:
+            self.set_on_channels(None)
+        else:
+            self.set_on_channels(lambda timestamp_ms, channels: callback(DMXFrame(timestamp_ms, channels)))
 
     def set_on_recording_complete(self, callback: Callable[[DMXRecording], None]):
         """Set callback when recording stops"""
         self._on_recording_complete = callback
 
-    def start_listening(self, bind_ip: str = "0.0.0.0", port: int = ARTNET_PORT) -> bool:
-        """Start listening for Art-Net packets"""
+    def start_listening(self, bind_ip: str = "0.0.0.0", port: int = ARTNET_PORT,
+                        interface: Optional[str] = None,
+                        cpu_affinity: Optional[int] = None) -> bool:
+        """Start listening for Art-Net packets
+
+        Args:
+            bind_ip: Local address to bind
+            port: UDP port
+            interface: Only receive on this NIC (e.g. "eth0"; needs CAP_NET_RAW)
+            cpu_affinity: Pin the listener thread to this CPU core, ideally the
+                one handling the NIC's receive IRQ, to cut timestamp jitter
+        """
         if self._running:
             logger.warning("Already listening")
             return True
@@ -252,11 +452,24 @@ class DMXRecorder:
         try:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, 'SO_REUSEPORT'):
+                self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            # The kernel caps this at net.core.rmem_max; raise that sysctl to get the full size
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, ARTNET_RCVBUF)
+            logger.debug(f"Art-Net receive buffer: "
+                         f"{self._socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)} bytes")
+            if interface:
+                try:
+                    self._socket.setsockopt(socket.SOL_SOCKET, SO_BINDTODEVICE,
+                                            interface.encode())
+                except OSError as e:
+                    logger.warning(f"Cannot bind Art-Net socket to {interface}: {e}")
             self._socket.bind((bind_ip, port))
-            self._socket.settimeout(0.5)
+            self._socket.setblocking(False)
 
             self._running = True
-            self._listen_thread = threading.Thread(target=self._listen_loop, daemon=True)
+            self._listen_thread = threading.Thread(target=self._listen_loop, args=(cpu_affinity,),
+                                                   daemon=True)
             self._listen_thread.start()
 
             logger.info(f"DMX Recorder listening on {bind_ip}:{port}")
@@ -298,7 +511,8 @@ class DMXRecorder:
             fps=40
         )
         self._record_universe = universe
-        self._record_start_time = time.time()
+        self._record_start_ns = time.monotonic_ns()
+        self._last_recorded = None
         self._recording = True
         self._frames_received = 0
 
@@ -316,7 +530,7 @@ class DMXRecorder:
 
         if recording:
             recording.trim_end_ms = recording.duration_ms
-            logger.info(f"Stopped recording '{recording.name}': {len(recording.frames)} frames, {recording.duration_ms}ms")
+            logger.info(f"Stopped recording '{recording.name}': {recording.frame_count} frames, {recording.duration_ms}ms")
 
             if self._on_recording_complete:
                 self._on_recording_complete(recording)
@@ -337,23 +551,62 @@ class DMXRecorder:
             "universe": self._record_universe if self._recording else None,
             "name": self._current_recording.name if self._current_recording else None,
             "duration_ms": self._current_recording.duration_ms if self._current_recording else 0,
-            "frame_count": len(self._current_recording.frames) if self._current_recording else 0,
+            "frame_count": self._current_recording.frame_count if self._current_recording else 0,
             "frames_received": self._frames_received,
-            "last_frame_age_ms": int((time.time() - self._last_frame_time) * 1000) if self._last_frame_time else None
+            "last_frame_age_ms": (time.monotonic_ns() - self._last_frame_ns) // 1_000_000 if self._last_frame_ns else None
         }
 
     def list_recordings(self) -> List[Dict]:
-        """List all saved recordings"""
+        """List all saved recordings
+
+        Recording info is cached in an index file keyed by file name, mtime
+        and size, so only new or modified recordings are opened.
+        """
+        index = self._load_index()
+        fresh_index = {}
         recordings = []
         for path in self.recordings_path.glob("*.dmxr"):
             try:
-                recording = DMXRecording.load(path)
-                if recording:
-                    recordings.append(recording.to_info_dict())
+                st = path.stat()
+                entry = index.get(path.name)
+                if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                    info = entry[2]
+                    info["file_path"] = str(path)
+                else:
+                    info = DMXRecording.load_info(path)
+                    if not info:
+                        continue
+                fresh_index[path.name] = [st.st_mtime_ns, st.st_size, info]
+                recordings.append(info)
             except Exception as e:
                 logger.warning(f"Failed to load recording {path}: {e}")
+
+        if fresh_index != index:
+            self._save_index(fresh_index)
         return recordings
 
+    def _load_index(self) -> Dict[str, list]:
+        """Load the recordings info index ({} if missing or unreadable)"""
+        index_file = self.recordings_path / RECORDINGS_INDEX
+        try:
+            with open(index_file, 'rb') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable recordings index: {e}")
+            return {}
+
+    def _save_index(self, index: Dict[str, list]):
+        """Write the recordings info index"""
+        index_file = self.recordings_path / RECORDINGS_INDEX
+        try:
+            tmp_file = index_file.with_name(index_file.name + '.tmp')
+            tmp_file.write_bytes(json.dumps(index).encode('utf-8'))
+            os.replace(tmp_file, index_file)
+        except Exception as e:
+            logger.warning(f"Failed to save recordings index: {e}")
+
     def load_recording(self, name_or_path: str) -> Optional[DMXRecording]:
         """Load a recording by name or path"""
         # Try as direct path
@@ -380,26 +633,53 @@ class DMXRecorder:
             return True
         return False
 
-    def _listen_loop(self):
+    def _listen_loop(self, cpu_affinity: Optional[int] = None):
         """Main loop for receiving Art-Net packets"""
-        while self._running:
+        if cpu_affinity is not None:
+            # On Linux both calls apply to the calling thread only
             try:
-                data, addr = self._socket.recvfrom(1024)
-                self._process_packet(data, addr)
-            except socket.timeout:
-                continue
-            except Exception as e:
-                if self._running:
-                    logger.error(f"Error receiving packet: {e}")
+                os.sched_setaffinity(0, {cpu_affinity})
+            except (AttributeError, OSError) as e:
+                logger.warning(f"Cannot pin DMX listener to CPU {cpu_affinity}: {e}")
+            try:
+                os.nice(LISTENER_NICE)
+            except OSError:
+                pass  # Raising priority needs CAP_SYS_NICE
+
+        # Receive into one reusable buffer instead of a new bytes per packet
+        buf = bytearray(ARTNET_RECV_SIZE)
+        view = memoryview(buf)
+        sock = self._socket
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(sock, selectors.EVENT_READ)
+            while self._running:
+                try:
+                    if not selector.select(timeout=0.5):
+                        continue
+                    # Drain everything queued in one wakeup (bounded for fairness)
+                    for _ in range(ARTNET_DRAIN_LIMIT):
+                        try:
+                            size, addr = sock.recvfrom_into(buf)
+                        except BlockingIOError:
+                            break
+                        self._process_packet(view[:size], addr)
+                except Exception as e:
+                    if self._running:
+                        logger.error(f"Error receiving packet: {e}")
+
+    def _process_packet(self, data: memoryview, addr: tuple):
+        """Process an incoming Art-Net packet
 
-    def _process_packet(self, data: bytes, addr: tuple):
-        """Process an incoming Art-Net packet"""
+        `data` views the shared receive buffer; copy anything kept.
+        """
         # Verify Art-Net header
         if len(data) < 18 or data[:8] != ARTNET_HEADER:
             return
 
-        # Get opcode (little-endian)
-        opcode = struct.unpack('<H', data[8:10])[0]
+        # Get opcode (little-endian); header fields are decoded from the
+        # bytes directly, cheaper than struct.unpack on slices
+        opcode = data[8] | (data[9] << 8)
 
         if opcode != ARTNET_OPCODE_DMX:
             return  # Not a DMX packet
@@ -412,34 +692,46 @@ class DMXRecorder:
         # Bytes 16-17: Length (big-endian)
         # Bytes 18+: DMX data
 
-        universe = struct.unpack('<H', data[14:16])[0]
-        length = struct.unpack('>H', data[16:18])[0]
-        dmx_data = list(data[18:18 + length])
-
-        # Pad to 512 channels if needed
-        while len(dmx_data) < 512:
-            dmx_data.append(0)
+        universe = data[14] | (data[15] << 8)
 
-        self._last_frame_time = time.time()
+        # One monotonic clock read per packet (immune to NTP steps)
+        now_ns = time.monotonic_ns()
+        self._last_frame_ns = now_ns
         self._frames_received += 1
 
-        # If recording and matching universe
-        if self._recording and universe == self._record_universe:
-            timestamp_ms = int((time.time() - self._record_start_time) * 1000)
-            self._current_recording.add_frame(timestamp_ms, dmx_data)
+        # Only copy the payload out if something consumes it: a recording
+        # on this universe or a live-preview callback
+        recording = self._current_recording if self._recording and universe == self._record_universe else None
+        callback = self._on_channels_callback
+        if recording is None and callback is None:
+            return
+
+        length = (data[16] << 8) | data[17]
+        # One bytes object per frame instead of 512 boxed ints
+        dmx_data = bytes(data[18:18 + min(length, DMX_CHANNELS)])
+
+        # Pad to 512 channels if needed
+        if len(dmx_data) < DMX_CHANNELS:
+            dmx_data = dmx_data.ljust(DMX_CHANNELS, b'\x00')
+
+        if recording is not None:
+            timestamp_ms = (now_ns - self._record_start_ns) // 1_000_000
+            if dmx_data == self._last_recorded:
+                # Consoles resend unchanged frames continuously; playback holds
+                # the previous frame anyway, so only extend the duration
+                recording.duration_ms = max(recording.duration_ms, timestamp_ms)
+            else:
+                recording.add_frame(timestamp_ms, dmx_data)
+                self._last_recorded = dmx_data
 
             # Store source IP on first frame
-            if not self._current_recording.source_ip:
-                self._current_recording.source_ip = addr[0]
+            if not recording.source_ip:
+                recording.source_ip = addr[0]
 
         # Callback for live preview
-        if self._on_frame_callback:
-            frame = DMXFrame(
-                timestamp_ms=int(time.time() * 1000),
-                channels=dmx_data
-            )
+        if callback is not None:
             try:
-                self._on_frame_callback(frame)
+                callback(time.time_ns() // 1_000_000, dmx_data)
             except Exception as e:
                 logger.warning(f"Frame callback error: {e}")
 
@@ -450,7 +742,7 @@ class DMXRecordingPlayer:
     Can be used standalone or integrated with ScenePlayer for sync.
     """
 
-    def __init__(self, dmx_output_callback: Callable[[List[int]], None]):
+    def __init__(self, dmx_output_callback: Callable[[bytes], None]):
         """
         Args:
             dmx_output_callback: Function to call with DMX channel values
@@ -485,12 +777,12 @@ class DMXRecordingPlayer:
 
         if self._paused:
             # Resume from pause
-            pause_duration = time.time() - self._pause_time
+            pause_duration = time.monotonic() - self._pause_time
             self._start_time += pause_duration
             self._paused = False
         else:
             # Start fresh
-            self._start_time = time.time()
+            self._start_time = time.monotonic()
             self._current_position_ms = 0
             self._playing = True
             self._play_thread = threading.Thread(target=self._playback_loop, daemon=True)
@@ -502,7 +794,7 @@ class DMXRecordingPlayer:
         """Pause playback"""
         if self._playing and not self._paused:
             self._paused = True
-            self._pause_time = time.time()
+            self._pause_time = time.monotonic()
             logger.info("Playback paused")
 
     def stop(self):
@@ -519,7 +811,7 @@ class DMXRecordingPlayer:
         """Seek to position"""
         if self._recording:
             self._current_position_ms = max(0, min(position_ms, self._recording.get_trimmed_duration()))
-            self._start_time = time.time() - (self._current_position_ms / 1000.0)
+            self._start_time = time.monotonic() - (self._current_position_ms / 1000.0)
 
     def get_position(self) -> int:
         """Get current playback position in ms"""
@@ -536,21 +828,26 @@ class DMXRecordingPlayer:
         """Main playback loop"""
         fps = self._recording.fps if self._recording else 40
         frame_time = 1.0 / fps
+        # Absolute deadline of the next frame, so a slow output callback
+        # does not push every later frame back
+        next_frame = time.monotonic()
 
         while self._playing:
             if self._paused:
                 time.sleep(0.05)
+                next_frame = time.monotonic()
                 continue
 
             # Calculate current position
-            elapsed = time.time() - self._start_time
+            now = time.monotonic()
+            elapsed = now - self._start_time
             self._current_position_ms = int(elapsed * 1000)
 
             # Check if finished
             duration = self._recording.get_trimmed_duration()
             if self._current_position_ms >= duration:
                 if self._loop:
-                    self._start_time = time.time()
+                    self._start_time = now
                     self._current_position_ms = 0
                 else:
                     self._playing = False
@@ -565,5 +862,11 @@ class DMXRecordingPlayer:
                 except Exception as e:
                     logger.error(f"Output callback error: {e}")
 
-            # Sleep until next frame
-            time.sleep(frame_time)
+            # Sleep until the next frame's deadline; if more than a frame
+            # behind, skip the missed frames instead of bursting to catch up
+            next_frame += frame_time
+            delay = next_frame - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -frame_time:
+                next_frame = time.monotonic()
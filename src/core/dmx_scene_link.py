@@ -4,15 +4,25 @@ Manages the association between DMX recordings and project scenes,
 allowing recordings to override or supplement project DMX sequences.
 """
 
-import json
 import logging
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, List
-from dataclasses import dataclass, asdict
+from typing import Optional, Dict, List, Sequence
+from dataclasses import dataclass, replace
 from enum import Enum
 
+from .config import atomic_write_bytes
+from .utils import json_loads, json_dumps_bytes
+
 logger = logging.getLogger(__name__)
 
+# Delay before writing link changes, so a burst of edits is saved once
+SAVE_DELAY = 0.2
+
+# bytes.translate table: 0xFF for a zero channel, 0x00 for any other value
+_ZERO_CHANNEL_MASK = bytes([0xFF] + [0x00] * 255)
+
 
 class DMXPlaybackMode(Enum):
     """DMX playback mode when a scene has both a project sequence and a recording"""
@@ -22,9 +32,9 @@ class DMXPlaybackMode(Enum):
     BLEND = "blend"  # Blend both (HTP - Highest Takes Precedence)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SceneRecordingLink:
-    """Link between a scene and a DMX recording"""
+    """Link between a scene and a DMX recording (immutable, see setters)"""
     scene_id: str
     recording_name: str  # Name of the .dmxr file (without extension)
     mode: str = "recording_priority"  # DMXPlaybackMode value
@@ -32,7 +42,13 @@ class SceneRecordingLink:
     offset_ms: int = 0  # Offset to apply when starting the recording
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            "scene_id": self.scene_id,
+            "recording_name": self.recording_name,
+            "mode": self.mode,
+            "enabled": self.enabled,
+            "offset_ms": self.offset_ms
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> "SceneRecordingLink":
@@ -52,14 +68,19 @@ class DMXSceneLinkManager:
         self.config_path = Path(config_path)
         self.links_file = self.config_path / "dmx_scene_links.json"
         self._links: Dict[str, SceneRecordingLink] = {}  # scene_id -> link
+
+        # Debounced saving
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False
+
         self._load()
 
     def _load(self):
         """Load links from file"""
         if self.links_file.exists():
             try:
-                with open(self.links_file, 'r') as f:
-                    data = json.load(f)
+                data = json_loads(self.links_file.read_bytes())
 
                 for link_data in data.get("links", []):
                     link = SceneRecordingLink.from_dict(link_data)
@@ -69,6 +90,26 @@ class DMXSceneLinkManager:
             except Exception as e:
                 logger.error(f"Failed to load DMX scene links: {e}")
 
+    def _mark_dirty(self):
+        """Schedule a save, restarting the delay if one is already pending"""
+        with self._save_lock:
+            self._dirty = True
+            if self._save_timer:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DELAY, self.flush)
+            self._save_timer.start()
+
+    def flush(self):
+        """Write pending link changes now (call on shutdown)"""
+        with self._save_lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._save()
+
     def _save(self):
         """Save links to file"""
         try:
@@ -79,8 +120,8 @@ class DMXSceneLinkManager:
                 "links": [link.to_dict() for link in self._links.values()]
             }
 
-            with open(self.links_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Compact JSON, encoded once and written in a single call
+            atomic_write_bytes(self.links_file, json_dumps_bytes(data))
 
             logger.info(f"Saved {len(self._links)} DMX scene links")
         except Exception as e:
@@ -98,7 +139,7 @@ class DMXSceneLinkManager:
                 offset_ms=offset_ms
             )
             self._links[scene_id] = link
-            self._save()
+            self._mark_dirty()
             logger.info(f"Linked scene {scene_id} to recording {recording_name}")
             return True
         except Exception as e:
@@ -109,7 +150,7 @@ class DMXSceneLinkManager:
         """Remove link from a scene"""
         if scene_id in self._links:
             del self._links[scene_id]
-            self._save()
+            self._mark_dirty()
             logger.info(f"Unlinked scene {scene_id}")
             return True
         return False
@@ -128,39 +169,42 @@ class DMXSceneLinkManager:
     def set_mode(self, scene_id: str, mode: str) -> bool:
         """Set the playback mode for a scene link"""
         if scene_id in self._links:
-            self._links[scene_id].mode = mode
-            self._save()
+            self._links[scene_id] = replace(self._links[scene_id], mode=mode)
+            self._mark_dirty()
             return True
         return False
 
     def set_enabled(self, scene_id: str, enabled: bool) -> bool:
         """Enable or disable a scene link"""
         if scene_id in self._links:
-            self._links[scene_id].enabled = enabled
-            self._save()
+            self._links[scene_id] = replace(self._links[scene_id], enabled=enabled)
+            self._mark_dirty()
             return True
         return False
 
     def set_offset(self, scene_id: str, offset_ms: int) -> bool:
         """Set the offset for a scene link"""
         if scene_id in self._links:
-            self._links[scene_id].offset_ms = offset_ms
-            self._save()
+            self._links[scene_id] = replace(self._links[scene_id], offset_ms=offset_ms)
+            self._mark_dirty()
             return True
         return False
 
 
-def blend_dmx_frames(project_channels: List[int], recording_channels: List[int],
-                     mode: str = "recording_priority") -> List[int]:
+def blend_dmx_frames(project_channels: Sequence[int], recording_channels: Sequence[int],
+                     mode: str = "recording_priority") -> Sequence[int]:
     """Blend two DMX frames according to the specified mode
 
+    The blend modes work on whole frames in C (bytes/int operations)
+    rather than looping over the 512 channels in Python.
+
     Args:
         project_channels: DMX channels from project sequence (512 values)
         recording_channels: DMX channels from recording (512 values)
         mode: Blend mode
 
     Returns:
-        Blended DMX channels (512 values)
+        Blended DMX channels (512 values, as bytes for the blend modes)
     """
     if mode == DMXPlaybackMode.PROJECT_ONLY.value:
         return project_channels
@@ -169,16 +213,48 @@ def blend_dmx_frames(project_channels: List[int], recording_channels: List[int],
         return recording_channels
 
     if mode == DMXPlaybackMode.RECORDING_PRIORITY.value:
-        # Recording takes priority - use recording values where non-zero
-        result = list(project_channels)
-        for i, val in enumerate(recording_channels):
-            if val > 0:
-                result[i] = val
-        return result
+        # Recording takes priority - use recording values where non-zero.
+        # As big integers: (project AND mask-of-zero-recording-channels) OR recording
+        project = bytes(project_channels)
+        size = len(project)
+        recording = bytes(recording_channels[:size]).ljust(size, b'\x00')
+        mask = recording.translate(_ZERO_CHANNEL_MASK)
+        result = (int.from_bytes(project, 'big') & int.from_bytes(mask, 'big')) \
+            | int.from_bytes(recording, 'big')
+        return result.to_bytes(size, 'big')
 
     if mode == DMXPlaybackMode.BLEND.value:
         # HTP (Highest Takes Precedence)
-        return [max(p, r) for p, r in zip(project_channels, recording_channels)]
+        size = min(len(project_channels), len(recording_channels))
+        return _max_bytes(bytes(project_channels[:size]), bytes(recording_channels[:size]))
 
     # Default: recording priority
     return recording_channels
+
+
+@lru_cache(maxsize=8)
+def _lane_masks(size: int):
+    """Per-lane constants for _max_bytes: (0x8000 in each lane, 0x00FF in each lane)"""
+    return (int.from_bytes(b'\x80\x00' * size, 'big'),
+            int.from_bytes(b'\x00\xff' * size, 'big'))
+
+
+def _max_bytes(a: bytes, b: bytes) -> bytes:
+    """Channel-wise max of two equal-length frames without a Python loop
+
+    Each channel is widened to a 16-bit lane of one big integer, so a
+    single subtraction compares all lanes at once: bit 15 of
+    (a | 0x8000) - b is set exactly where a >= b, and no lane can borrow
+    from its neighbour. That bit is spread into a 0xFF select mask.
+    """
+    size = len(a)
+    high, low = _lane_masks(size)
+    wide = bytearray(2 * size)
+    wide[1::2] = a
+    a_lanes = int.from_bytes(wide, 'big')
+    wide[1::2] = b
+    b_lanes = int.from_bytes(wide, 'big')
+
+    mask = ((((a_lanes | high) - b_lanes) & high) >> 15) * 0xFF
+    result = (a_lanes & mask) | (b_lanes & (mask ^ low))
+    return result.to_bytes(2 * size, 'big')[1::2]
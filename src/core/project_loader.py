@@ -1,14 +1,18 @@
 """Project Loader - Load and parse Flow project packages"""
 
 import os
-import json
+import sys
 import shutil
 import zipfile
 import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from datetime import datetime
 
 from .exceptions import (
@@ -17,11 +21,52 @@ from .exceptions import (
     InvalidProjectError,
     MediaNotFoundError
 )
+from .utils import json_loads, json_dumps_bytes
 
 logger = logging.getLogger(__name__)
 
+# Scene element types that reference a media file through properties["src"]
+_MEDIA_ELEMENT_TYPES = frozenset(('video', 'audio', 'image'))
 
-@dataclass
+# datetime.fromisoformat accepts a "Z" UTC suffix from Python 3.11
+_FROMISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Threads used to read and parse separate scene files when loading a project
+SCENE_LOAD_WORKERS = 4
+
+# Threads used to extract show packages on import
+ZIP_EXTRACT_WORKERS = 4
+
+
+@lru_cache(maxsize=512)
+def _show_id_for(name: str) -> str:
+    """Show ID for a folder name (memoized: the same names are hashed on every lookup)
+
+    Stays MD5-based: show IDs are persisted as the active show in the
+    player config, so changing the hash would orphan saved references.
+    """
+    return hashlib.md5(name.encode()).hexdigest()[:12]
+
+
+def _zip_member_path(extract_path: Path, member: zipfile.ZipInfo) -> str:
+    """Target path of a zip member, sanitized the way ZipFile.extract does"""
+    arcname = member.filename.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    parts = [x for x in arcname.split(os.path.sep) if x not in ('', os.path.curdir, os.path.pardir)]
+    return os.path.join(extract_path, *parts)
+
+
+@lru_cache(maxsize=256)
+def _parse_iso_datetime(date_str: str) -> datetime:
+    """Parse an ISO 8601 timestamp, including a trailing "Z" (memoized)"""
+    if not _FROMISO_ACCEPTS_Z and date_str.endswith('Z'):
+        date_str = date_str[:-1] + '+00:00'
+    return datetime.fromisoformat(date_str)
+
+
+@dataclass(slots=True)
 class MediaItem:
     """Represents a media item in the project"""
     id: str
@@ -33,7 +78,7 @@ class MediaItem:
     dimensions: Optional[Dict[str, int]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SceneElement:
     """Represents an element in a scene"""
     id: str
@@ -46,8 +91,25 @@ class SceneElement:
     opacity: float = 1.0
     z_index: int = 0
 
+    # Media source, classified once (see __post_init__)
+    _src: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _src_is_path: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Element types are compared on every media/video scan; interned
+        # strings let those comparisons succeed on identity
+        if type(self.type) is str:
+            self.type = sys.intern(self.type)
 
-@dataclass
+        # A src containing "/" or starting with "media" is a direct path,
+        # anything else is a media ID reference
+        src = self.properties.get('src') if self.type in _MEDIA_ELEMENT_TYPES else None
+        if src:
+            self._src = src
+            self._src_is_path = '/' in src or src.startswith('media')
+
+
+@dataclass(slots=True)
 class Scene:
     """Represents a scene in the project"""
     id: str
@@ -63,13 +125,16 @@ class Scene:
     node_graph_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MeshGrid:
     """Mesh grid for advanced warping"""
     rows: int = 1
     cols: int = 1
     points: List[List[Dict[str, float]]] = field(default_factory=list)
 
+    # is_deformed result (grids are not edited after parsing)
+    _deformed_cache: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+
     def get_point(self, row: int, col: int) -> Dict[str, float]:
         """Get a specific grid point"""
         if 0 <= row < len(self.points) and 0 <= col < len(self.points[row]):
@@ -78,18 +143,32 @@ class MeshGrid:
 
     def is_deformed(self) -> bool:
         """Check if the mesh has any deformation"""
+        if self._deformed_cache is None:
+            self._deformed_cache = self._compute_deformed()
+        return self._deformed_cache
+
+    def _compute_deformed(self) -> bool:
+        """Compare every point against the regular grid"""
+        col_step = 1 / self.cols if self.cols > 0 else 0
+        row_step = 1 / self.rows if self.rows > 0 else 0
+        # Expected x per column is the same for every row: compute it once
+        width = max((len(row) for row in self.points), default=0)
+        expected_xs = [col_idx * col_step for col_idx in range(width)]
         for row_idx, row in enumerate(self.points):
-            for col_idx, point in enumerate(row):
-                expected_x = col_idx / self.cols if self.cols > 0 else 0
-                expected_y = row_idx / self.rows if self.rows > 0 else 0
+            expected_y = row_idx * row_step
+            for point, expected_x in zip(row, expected_xs):
                 if abs(point.get("x", 0) - expected_x) > 0.001 or abs(point.get("y", 0) - expected_y) > 0.001:
                     return True
         return False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VideoMappingConfig:
-    """Video mapping configuration - supports perspective and mesh warping"""
+    """Video mapping configuration - supports perspective and mesh warping
+
+    Immutable once parsed, so derived values (is_deformed, to_dict) are
+    computed once and cached on the instance.
+    """
     enabled: bool = False
     mode: str = "perspective"  # "perspective" or "mesh"
 
@@ -110,8 +189,18 @@ class VideoMappingConfig:
     # Linked scene (from displayConfig)
     scene_id: Optional[str] = None
 
+    # Cached is_deformed / to_dict results
+    _deformed_cache: Optional[bool] = field(default=None, init=False, repr=False, compare=False)
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
     def is_deformed(self) -> bool:
         """Check if mapping has any actual deformation"""
+        if self._deformed_cache is None:
+            object.__setattr__(self, "_deformed_cache", self._compute_deformed())
+        return self._deformed_cache
+
+    def _compute_deformed(self) -> bool:
+        """Check the mesh grid or the perspective corners"""
         if not self.enabled:
             return False
 
@@ -121,13 +210,19 @@ class VideoMappingConfig:
         # Check perspective deformation
         default_corners = [(0, 0), (1, 0), (0, 1), (1, 1)]
         actual_corners = [self.top_left, self.top_right, self.bottom_left, self.bottom_right]
-        for default, actual in zip(default_corners, actual_corners):
-            if abs(default[0] - actual[0]) > 0.001 or abs(default[1] - actual[1]) > 0.001:
-                return True
-        return False
+        return any(
+            abs(default[0] - actual[0]) > 0.001 or abs(default[1] - actual[1]) > 0.001
+            for default, actual in zip(default_corners, actual_corners)
+        )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for API responses"""
+        """Convert to dictionary for API responses (shared dict, do not modify)"""
+        if self._dict_cache is None:
+            object.__setattr__(self, "_dict_cache", self._build_dict())
+        return self._dict_cache
+
+    def _build_dict(self) -> Dict[str, Any]:
+        """Uncached to_dict"""
         result = {
             "enabled": self.enabled,
             "mode": self.mode,
@@ -158,7 +253,7 @@ class VideoMappingConfig:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class DMXSequence:
     """DMX lighting sequence"""
     id: str
@@ -171,7 +266,7 @@ class DMXSequence:
     interpolation: str = "linear"
 
 
-@dataclass
+@dataclass(slots=True)
 class StandaloneSceneSlot:
     """Represents a standalone scene slot from Flow export"""
     id: str
@@ -181,7 +276,7 @@ class StandaloneSceneSlot:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Represents a loaded Flow project"""
     id: str
@@ -217,6 +312,16 @@ class Project:
     exported_for_player: bool = False
     player_export_version: str = ""
 
+    # Lookup indexes by ID (see rebuild_indexes)
+    _scene_by_id: Dict[str, Scene] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _media_by_id: Dict[str, MediaItem] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _dmx_by_id: Dict[str, DMXSequence] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _mapping_by_scene_id: Dict[str, VideoMappingConfig] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # Element views, built on first use and reset by rebuild_indexes
+    _video_elements: Optional[List[SceneElement]] = field(default=None, init=False, repr=False, compare=False)
+    _scene_media: Dict[str, List[Dict[str, Any]]] = field(default_factory=dict, init=False, repr=False, compare=False)
+
     @property
     def total_duration_ms(self) -> int:
         """Get total project duration in milliseconds"""
@@ -224,12 +329,25 @@ class Project:
             return max(s.duration_ms for s in self.scenes)
         return 0
 
+    def rebuild_indexes(self):
+        """Rebuild the ID lookup indexes and drop cached element lists
+
+        Must be called after scenes, elements, media, DMX sequences or video
+        mappings are modified. On duplicate IDs the first item wins, as with
+        a scan.
+        """
+        self._scene_by_id = {s.id: s for s in reversed(self.scenes)}
+        self._media_by_id = {m.id: m for m in reversed(self.media)}
+        self._dmx_by_id = {d.id: d for d in reversed(self.dmx_sequences)}
+        self._mapping_by_scene_id = {
+            m.scene_id: m for m in reversed(self.video_mappings) if m.enabled
+        }
+        self._video_elements = None
+        self._scene_media = {}
+
     def get_scene(self, scene_id: str) -> Optional[Scene]:
         """Get scene by ID"""
-        for scene in self.scenes:
-            if scene.id == scene_id:
-                return scene
-        return None
+        return self._scene_by_id.get(scene_id)
 
     def get_start_scene(self) -> Optional[Scene]:
         """Get the starting scene"""
@@ -241,26 +359,19 @@ class Project:
 
     def get_media(self, media_id: str) -> Optional[MediaItem]:
         """Get media item by ID"""
-        for item in self.media:
-            if item.id == media_id:
-                return item
-        return None
+        return self._media_by_id.get(media_id)
 
     def get_video_elements(self) -> List[SceneElement]:
-        """Get all video elements across all scenes"""
-        elements = []
-        for scene in self.scenes:
-            for elem in scene.elements:
-                if elem.type == "video":
-                    elements.append(elem)
-        return elements
+        """Get all video elements across all scenes (shared list, do not modify)"""
+        if self._video_elements is None:
+            self._video_elements = [
+                elem for scene in self.scenes for elem in scene.elements if elem.type == "video"
+            ]
+        return self._video_elements
 
     def get_dmx_sequence(self, sequence_id: str) -> Optional[DMXSequence]:
         """Get DMX sequence by ID"""
-        for seq in self.dmx_sequences:
-            if seq.id == sequence_id:
-                return seq
-        return None
+        return self._dmx_by_id.get(sequence_id)
 
     def get_scene_dmx_sequence(self, scene: Scene) -> Optional[DMXSequence]:
         """Get the DMX sequence linked to a scene
@@ -279,9 +390,9 @@ class Project:
         falls back to global video_mapping if no scene-specific mapping.
         """
         # First check scene-specific mappings
-        for mapping in self.video_mappings:
-            if mapping.scene_id == scene_id and mapping.enabled:
-                return mapping
+        mapping = self._mapping_by_scene_id.get(scene_id)
+        if mapping:
+            return mapping
 
         # Fall back to global mapping
         if self.video_mapping and self.video_mapping.enabled:
@@ -294,47 +405,59 @@ class Project:
 
         Returns list of dicts with element info and resolved media paths.
         Handles both media ID references and direct path references.
+        Lists for project scenes are built on first request and cached
+        (shared, do not modify).
         """
-        media_list = []
-
-        for element in scene.elements:
-            if element.type in ['video', 'audio', 'image']:
-                src = element.properties.get('src')
-                if src:
-                    file_path = None
-                    media_id = None
-
-                    # Check if src is a path (contains / or starts with media/)
-                    if '/' in src or src.startswith('media'):
-                        # Direct path reference
-                        file_path = self.base_path / src if self.base_path else Path(src)
-                        media_id = src
-                    else:
-                        # Media ID reference - look up in media list
-                        media = self.get_media(src)
-                        if media:
-                            file_path = media.path
-                            media_id = src
-
-                    if file_path:
-                        media_list.append({
-                            'element_id': element.id,
-                            'element_type': element.type,
-                            'element_name': element.name,
-                            'media_id': media_id,
-                            'file_path': file_path,
-                            'autoplay': element.properties.get('autoplay', False),
-                            'loop': element.properties.get('loop', False),
-                            'volume': element.properties.get('volume', 1.0),
-                            'muted': element.properties.get('muted', False),
-                            'position': element.position,
-                            'size': element.size,
-                            'z_index': element.z_index,
-                            'visible': element.visible,
-                            'opacity': element.opacity,
-                        })
-
-        return sorted(media_list, key=lambda x: x['z_index'])
+        if self._scene_by_id.get(scene.id) is not scene:
+            return self._build_scene_media(scene)
+        media_list = self._scene_media.get(scene.id)
+        if media_list is None:
+            media_list = self._scene_media[scene.id] = self._build_scene_media(scene)
+        return media_list
+
+    def _build_scene_media(self, scene: Scene) -> List[Dict[str, Any]]:
+        """Uncached get_scene_media"""
+        # Elements are visited in z order (stable), so the list needs no sort
+        return [
+            self._scene_media_entry(element, file_path)
+            for element in sorted(scene.elements, key=attrgetter('z_index'))
+            if (file_path := self._resolve_element_media(element))
+        ]
+
+    def _resolve_element_media(self, element: SceneElement) -> Optional[Path]:
+        """File path of an element's media source (None if it has none or it is unknown)"""
+        src = element._src
+        if not src:
+            return None
+
+        if element._src_is_path:
+            # Direct path reference
+            return self.base_path / src if self.base_path else Path(src)
+
+        # Media ID reference - look up in media list
+        media = self.get_media(src)
+        return media.path if media else None
+
+    @staticmethod
+    def _scene_media_entry(element: SceneElement, file_path: Path) -> Dict[str, Any]:
+        """get_scene_media entry for an element with resolved media"""
+        properties = element.properties
+        return {
+            'element_id': element.id,
+            'element_type': element.type,
+            'element_name': element.name,
+            'media_id': element._src,
+            'file_path': file_path,
+            'autoplay': properties.get('autoplay', False),
+            'loop': properties.get('loop', False),
+            'volume': properties.get('volume', 1.0),
+            'muted': properties.get('muted', False),
+            'position': element.position,
+            'size': element.size,
+            'z_index': element.z_index,
+            'visible': element.visible,
+            'opacity': element.opacity,
+        }
 
 
 class ProjectLoader:
@@ -346,90 +469,214 @@ class ProjectLoader:
 
         self._loaded_projects: Dict[str, Project] = {}
 
+        # list_shows cache: entry name -> (modification stamp, show dict)
+        self._shows_cache: Dict[str, tuple] = {}
+        self._shows_listing: Optional[tuple] = None  # (shows_path mtime_ns, entries)
+        self._show_index: Optional[tuple] = None  # (listing entries, show ID -> entry)
+
+        # Folders checked for a leftover <folder>.zip when a show is deleted
+        self._zip_search_dirs = (
+            str(self.shows_path),
+            str(self.shows_path.parent / "datas"),
+            "/tmp",
+        )
+
     def list_shows(self) -> List[Dict[str, Any]]:
-        """List all available shows with import timestamps"""
+        """List all available shows with import timestamps
+
+        Entries are cached per folder/zip and only re-read when their
+        modification times change; the top-level listing itself is reused
+        while the shows folder mtime is unchanged. Folder sizes are measured
+        on every call: media can change without touching project.json.
+        """
         shows = []
+        cache: Dict[str, tuple] = {}
 
-        for item in self.shows_path.iterdir():
-            if item.is_dir():
-                project_file = item / "project.json"
-                if project_file.exists():
-                    try:
-                        with open(project_file, 'r') as f:
-                            data = json.load(f)
-
-                        # Get import timestamp from metadata file or folder mtime
-                        imported_at = self._get_import_timestamp(item)
-
-                        shows.append({
-                            "id": self._generate_show_id(item.name),
-                            "name": data.get("name", item.name),
-                            "description": data.get("description", ""),
-                            "author": data.get("author", ""),
-                            "path": str(item),
-                            "folder_name": item.name,
-                            "duration_ms": self._get_project_duration(data),
-                            "size_mb": self._get_folder_size_mb(item),
-                            "created": data.get("created", ""),
-                            "modified": data.get("modified", ""),
-                            "imported_at": imported_at,
-                        })
-                    except Exception as e:
-                        logger.warning(f"Error reading project {item.name}: {e}")
-
-            elif item.suffix == ".zip":
-                # Unextracted zip file
-                stat = item.stat()
-                shows.append({
-                    "id": self._generate_show_id(item.stem),
-                    "name": item.stem,
-                    "description": "",
-                    "path": str(item),
-                    "folder_name": item.stem,
-                    "size_mb": round(stat.st_size / (1024 * 1024), 2),
-                    "is_zip": True,
-                    "imported_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                })
+        shows_dir = str(self.shows_path)
+
+        for name, is_dir in self._scan_shows_path():
+            # Plain string paths for the stat checks: a Path is only built
+            # for entries that have to be re-read
+            try:
+                signature = self._show_signature(os.path.join(shows_dir, name), is_dir)
+            except OSError:
+                continue
+            if signature is None:
+                continue
+
+            cached = self._shows_cache.get(name)
+            if cached and cached[0] == signature:
+                show = cached[1]
+                if is_dir:
+                    show = {**show, "size_mb": self._get_folder_size_mb(self.shows_path / name)}
+            else:
+                show = self._read_show_entry(self.shows_path / name, is_dir, signature)
+                if show is None:
+                    continue
+            cache[name] = (signature, show)
+            shows.append(dict(show))
+
+        self._shows_cache = cache
 
         # Sort by import date (most recent first)
         shows.sort(key=lambda x: x.get("imported_at", ""), reverse=True)
 
         return shows
 
-    def _get_import_timestamp(self, project_path: Path) -> str:
-        """Get import timestamp for a project
+    def _scan_shows_path(self) -> List[tuple]:
+        """(name, is_dir) for each show candidate, rescanned only when the folder changes"""
+        mtime = self.shows_path.stat().st_mtime_ns
+        if self._shows_listing and self._shows_listing[0] == mtime:
+            return self._shows_listing[1]
+
+        entries = []
+        with os.scandir(self.shows_path) as it:
+            for entry in it:
+                if entry.is_dir():
+                    entries.append((entry.name, True))
+                elif entry.name.endswith(".zip"):
+                    entries.append((entry.name, False))
+
+        self._shows_listing = (mtime, entries)
+        return entries
+
+    def _ensure_index(self) -> Dict[str, tuple]:
+        """Show ID -> (entry name, is_dir), rebuilt whenever the listing is rescanned
+
+        A show folder takes precedence over an unextracted zip of the same name.
+        """
+        entries = self._scan_shows_path()
+        if self._show_index and self._show_index[0] is entries:
+            return self._show_index[1]
+
+        index: Dict[str, tuple] = {}
+        for name, is_dir in entries:
+            show_id = self._generate_show_id(name if is_dir else name[:-4])
+            if is_dir or show_id not in index:
+                index[show_id] = (name, is_dir)
 
-        First checks for .import_meta file, then falls back to folder mtime.
+        self._show_index = (entries, index)
+        return index
+
+    def _show_signature(self, item: str, is_dir: bool) -> Optional[tuple]:
+        """Modification stamp of a show entry (None if it is not a show)"""
+        if not is_dir:
+            stat = os.stat(item)
+            return (stat.st_mtime_ns, stat.st_size)
+
+        try:
+            project_stat = os.stat(os.path.join(item, "project.json"))
+        except FileNotFoundError:
+            return None
+        return (os.stat(item).st_mtime_ns, project_stat.st_mtime_ns, project_stat.st_size)
+
+    def _read_show_entry(self, item: Path, is_dir: bool, signature: tuple) -> Optional[Dict[str, Any]]:
+        """Build the list_shows entry for a show folder or unextracted zip
+
+        The stat results already taken for the signature (see
+        _show_signature) are reused instead of statting the entry again.
         """
-        meta_file = project_path / ".import_meta"
-        if meta_file.exists():
+        if is_dir:
             try:
-                with open(meta_file, 'r') as f:
-                    meta = json.load(f)
-                    return meta.get("imported_at", "")
-            except Exception:
-                pass
+                meta = self._read_import_meta(item)
+                project_stamp = list(signature[1:])
+
+                # Summary stored in the import metadata at import time, valid
+                # while project.json is unchanged; otherwise parse it (listing
+                # is a read path and does not rewrite the metadata)
+                summary = meta.get("summary") if meta else None
+                if not summary or summary.get("project_stamp") != project_stamp:
+                    data = json_loads((item / "project.json").read_bytes())
+                    summary = self._build_show_summary(item, data, project_stamp)
+
+                # Get import timestamp from metadata file or folder mtime
+                if meta is not None:
+                    imported_at = meta.get("imported_at", "")
+                else:
+                    imported_at = datetime.fromtimestamp(signature[0] / 1e9).isoformat()
+
+                return {
+                    "id": self._generate_show_id(item.name),
+                    "name": summary["name"],
+                    "description": summary["description"],
+                    "author": summary["author"],
+                    "path": str(item),
+                    "folder_name": item.name,
+                    "duration_ms": summary["duration_ms"],
+                    "size_mb": self._get_folder_size_mb(item),
+                    "created": summary["created"],
+                    "modified": summary["modified"],
+                    "imported_at": imported_at,
+                }
+            except Exception as e:
+                logger.warning(f"Error reading project {item.name}: {e}")
+                return None
+
+        # Unextracted zip file
+        mtime_ns, size = signature
+        return {
+            "id": self._generate_show_id(item.stem),
+            "name": item.stem,
+            "description": "",
+            "path": str(item),
+            "folder_name": item.stem,
+            "size_mb": round(size / (1024 * 1024), 2),
+            "is_zip": True,
+            "imported_at": datetime.fromtimestamp(mtime_ns / 1e9).isoformat(),
+        }
+
+    def _build_show_summary(self, project_path: Path, data: dict,
+                            project_stamp: List[int]) -> Dict[str, Any]:
+        """Show listing fields derived from project.json
+
+        project_stamp is the [mtime_ns, size] of the project.json they were
+        read from. The folder size is not included: it depends on the media
+        files, which can change independently.
+        """
+        return {
+            "project_stamp": project_stamp,
+            "name": data.get("name", project_path.name),
+            "description": data.get("description", ""),
+            "author": data.get("author", ""),
+            "duration_ms": self._get_project_duration(data),
+            "created": data.get("created", ""),
+            "modified": data.get("modified", ""),
+        }
+
+    def _read_import_meta(self, project_path: Path) -> Optional[Dict[str, Any]]:
+        """Read a project's .import_meta (None if missing or unreadable)"""
+        try:
+            meta = json_loads((project_path / ".import_meta").read_bytes())
+        except Exception:
+            return None
+        return meta if isinstance(meta, dict) else None
 
-        # Fallback to folder modification time
-        stat = project_path.stat()
-        return datetime.fromtimestamp(stat.st_mtime).isoformat()
+    def _write_import_meta(self, project_path: Path, meta: Dict[str, Any]):
+        """Write a project's .import_meta"""
+        try:
+            (project_path / ".import_meta").write_bytes(json_dumps_bytes(meta, indent=True))
+        except Exception as e:
+            logger.warning(f"Failed to save import metadata: {e}")
 
     def _save_import_metadata(self, project_path: Path, source_zip: Optional[Path] = None):
-        """Save import metadata for a project"""
-        meta_file = project_path / ".import_meta"
+        """Save import metadata for a project, with its show listing summary"""
         meta = {
             "imported_at": datetime.now().isoformat(),
             "source_zip": str(source_zip) if source_zip else None,
         }
         try:
-            with open(meta_file, 'w') as f:
-                json.dump(meta, f, indent=2)
+            project_file = project_path / "project.json"
+            stat = project_file.stat()
+            meta["summary"] = self._build_show_summary(
+                project_path, json_loads(project_file.read_bytes()),
+                [stat.st_mtime_ns, stat.st_size])
         except Exception as e:
-            logger.warning(f"Failed to save import metadata: {e}")
+            logger.debug(f"No show summary for {project_path.name}: {e}")
+        self._write_import_meta(project_path, meta)
 
     def _generate_show_id(self, name: str) -> str:
         """Generate a unique show ID from name"""
-        return hashlib.md5(name.encode()).hexdigest()[:12]
+        return _show_id_for(name)
 
     def _get_project_duration(self, data: dict) -> int:
         """Get project duration from project data"""
@@ -439,11 +686,23 @@ class ProjectLoader:
         return 0
 
     def _get_folder_size_mb(self, path: Path) -> float:
-        """Get folder size in MB"""
+        """Get folder size in MB
+
+        Walks with os.scandir: DirEntry reports the file type from readdir,
+        so only regular files need a stat() and no Path objects are built.
+        """
         total = 0
-        for item in path.rglob("*"):
-            if item.is_file():
-                total += item.stat().st_size
+        stack = [str(path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except OSError:
+                continue
         return round(total / (1024 * 1024), 2)
 
     def import_show(self, zip_path: Path, show_name: Optional[str] = None,
@@ -478,8 +737,7 @@ class ProjectLoader:
 
         # Extract zip
         logger.info(f"Extracting {zip_path} to {extract_path}")
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            zf.extractall(extract_path)
+        self._extract_zip(zip_path, extract_path)
 
         # Verify project.json exists
         project_file = extract_path / "project.json"
@@ -499,6 +757,8 @@ class ProjectLoader:
         # Save import metadata (timestamp and source zip path)
         self._save_import_metadata(extract_path, zip_path)
 
+        self._shows_listing = None
+
         show_id = self._generate_show_id(folder_name)
         logger.info(f"Show imported: {folder_name} (ID: {show_id})")
 
@@ -512,6 +772,46 @@ class ProjectLoader:
 
         return show_id
 
+    def _extract_zip(self, zip_path: Path, extract_path: Path):
+        """Extract a show package, several members at a time
+
+        zipfile is not safe for concurrent reads from one ZipFile, so each
+        worker thread opens its own handle. Directory entries are created
+        up front instead of being extracted, so empty folders are kept and
+        the workers only write files.
+        """
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            members = zf.infolist()
+            files = [m for m in members if not m.is_dir()]
+            if len(files) < 2:
+                zf.extractall(extract_path)
+                return
+
+        for member in members:
+            if member.is_dir():
+                os.makedirs(_zip_member_path(extract_path, member), exist_ok=True)
+
+        local = threading.local()
+        handles: List[zipfile.ZipFile] = []
+
+        def extract(member: zipfile.ZipInfo):
+            zf = getattr(local, "zf", None)
+            if zf is None:
+                zf = local.zf = zipfile.ZipFile(zip_path, 'r')
+                handles.append(zf)
+            try:
+                zf.extract(member, extract_path)
+            except FileExistsError:
+                # Another thread created the same parent directory first
+                zf.extract(member, extract_path)
+
+        try:
+            with ThreadPoolExecutor(max_workers=ZIP_EXTRACT_WORKERS) as pool:
+                list(pool.map(extract, files))
+        finally:
+            for zf in handles:
+                zf.close()
+
     def load_project(self, show_id_or_path: str) -> Project:
         """Load a project from disk
 
@@ -541,8 +841,7 @@ class ProjectLoader:
             raise InvalidProjectError(f"No project.json in {project_path}")
 
         # Load project data
-        with open(project_file, 'r') as f:
-            data = json.load(f)
+        data = json_loads(project_file.read_bytes())
 
         project = self._parse_project(data, project_path)
         self._loaded_projects[project.id] = project
@@ -580,11 +879,14 @@ class ProjectLoader:
                 dimensions=media_data.get("dimensions"),
             ))
 
-        # Parse scenes
-        for scene_data in data.get("scenes", []):
-            scene = self._load_scene(scene_data, base_path)
-            if scene:
-                project.scenes.append(scene)
+        # Parse scenes (scene files are read and parsed in parallel, order is kept)
+        scene_refs = data.get("scenes", [])
+        if sum(1 for ref in scene_refs if ref.get("file")) > 1:
+            with ThreadPoolExecutor(max_workers=SCENE_LOAD_WORKERS) as pool:
+                scenes = list(pool.map(lambda ref: self._load_scene(ref, base_path), scene_refs))
+        else:
+            scenes = [self._load_scene(ref, base_path) for ref in scene_refs]
+        project.scenes.extend(scene for scene in scenes if scene)
 
         # Parse Art-Net config
         project.artnet_config = data.get("artnetConfig", {})
@@ -671,6 +973,7 @@ class ProjectLoader:
                         if not project.video_mapping:
                             project.video_mapping = mapping
 
+        project.rebuild_indexes()
         return project
 
     def _parse_video_mapping(self, vm: dict, scene_id: str = None) -> Optional[VideoMappingConfig]:
@@ -728,8 +1031,7 @@ class ProjectLoader:
             scene_path = base_path / scene_file
             if scene_path.exists():
                 try:
-                    with open(scene_path, 'r') as f:
-                        scene_data = json.load(f)
+                    scene_data = json_loads(scene_path.read_bytes())
                     return self._parse_scene(scene_data)
                 except Exception as e:
                     logger.error(f"Error loading scene {scene_file}: {e}")
@@ -773,8 +1075,8 @@ class ProjectLoader:
         if not date_str:
             return datetime.now()
         try:
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        except Exception:
+            return _parse_iso_datetime(date_str)
+        except (ValueError, TypeError):
             return datetime.now()
 
     def _create_default_scenes(self, project: Project, data: dict) -> List[Scene]:
@@ -857,69 +1159,55 @@ class ProjectLoader:
         Returns:
             True if deleted successfully
         """
-        deleted = False
-        folder_name = None
-
-        # Find and delete the project folder
-        for item in self.shows_path.iterdir():
-            if item.is_dir():
-                if self._generate_show_id(item.name) == show_id:
-                    folder_name = item.name
-
-                    # Try to get source zip path from metadata
-                    source_zip = None
-                    if delete_source_zip:
-                        meta_file = item / ".import_meta"
-                        if meta_file.exists():
-                            try:
-                                with open(meta_file, 'r') as f:
-                                    meta = json.load(f)
-                                    source_zip = meta.get("source_zip")
-                            except Exception:
-                                pass
-
-                    # Delete the project folder
-                    shutil.rmtree(item)
-                    logger.info(f"Show deleted: {item.name}")
-                    deleted = True
-
-                    # Delete source zip if found
-                    if source_zip:
-                        source_zip_path = Path(source_zip)
-                        if source_zip_path.exists():
-                            try:
-                                source_zip_path.unlink()
-                                logger.info(f"Source zip deleted: {source_zip_path}")
-                            except Exception as e:
-                                logger.warning(f"Failed to delete source zip: {e}")
-                    break
-
-        # Also look for zip files with matching name in shows folder and common locations
-        if folder_name:
-            zip_locations = [
-                self.shows_path / f"{folder_name}.zip",
-                self.shows_path.parent / "datas" / f"{folder_name}.zip",
-                Path("/tmp") / f"{folder_name}.zip",
-            ]
+        entry = self._ensure_index().get(show_id)
+        self._shows_listing = None
+        if entry is None:
+            return False
 
-            for zip_path in zip_locations:
-                if zip_path.exists():
-                    try:
-                        zip_path.unlink()
-                        logger.info(f"Associated zip deleted: {zip_path}")
-                    except Exception as e:
-                        logger.warning(f"Failed to delete zip {zip_path}: {e}")
+        folder_name, is_dir = entry
+        item = self.shows_path / folder_name
+
+        # Unextracted zip file in shows folder
+        if not is_dir:
+            item.unlink()
+            logger.info(f"Show zip deleted: {item.name}")
+            return True
+
+        # Try to get source zip path from metadata
+        source_zip = None
+        if delete_source_zip:
+            meta = self._read_import_meta(item)
+            if meta:
+                source_zip = meta.get("source_zip")
+
+        # Delete the project folder
+        shutil.rmtree(item)
+        logger.info(f"Show deleted: {item.name}")
+
+        # Delete source zip if found. Candidate zips are unlinked directly:
+        # a missing file costs one failed unlink instead of a stat + unlink
+        if source_zip:
+            try:
+                os.unlink(source_zip)
+                logger.info(f"Source zip deleted: {source_zip}")
+            except (FileNotFoundError, IsADirectoryError):
+                pass
+            except Exception as e:
+                logger.warning(f"Failed to delete source zip: {e}")
 
-        # Also check for unextracted zip files in shows folder
-        if not deleted:
-            for item in self.shows_path.iterdir():
-                if item.suffix == ".zip":
-                    if self._generate_show_id(item.stem) == show_id:
-                        item.unlink()
-                        logger.info(f"Show zip deleted: {item.name}")
-                        return True
+        # Also look for zip files with matching name in shows folder and common locations
+        zip_name = f"{folder_name}.zip"
+        for search_dir in self._zip_search_dirs:
+            zip_path = os.path.join(search_dir, zip_name)
+            try:
+                os.unlink(zip_path)
+                logger.info(f"Associated zip deleted: {zip_path}")
+            except (FileNotFoundError, IsADirectoryError):
+                continue
+            except Exception as e:
+                logger.warning(f"Failed to delete zip {zip_path}: {e}")
 
-        return deleted
+        return True
 
     def get_loaded_project(self, project_id: str) -> Optional[Project]:
         """Get a loaded project by ID"""
@@ -3,13 +3,17 @@
 import time
 import logging
 import threading
-from typing import Optional, Dict, Any, List, Callable, TYPE_CHECKING
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Callable, Sequence, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
 from .project_loader import Project, Scene, DMXSequence
-from .utils import interpolate_value
+from .exceptions import MediaNotFoundError
+from .dmx_scene_link import DMXPlaybackMode, blend_dmx_frames
+from .utils import easing_curve
 
 if TYPE_CHECKING:
     from .dmx_scene_link import DMXSceneLinkManager, SceneRecordingLink
@@ -17,6 +21,27 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Worker threads for scene loading steps that can overlap (video player setup)
+_LOAD_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="scene-load")
+
+
+def _channel_bytes(values: List[int]) -> bytes:
+    """Keyframe channel values as bytes (clamped to 0-255 like DMXPlayer.set_channels)"""
+    try:
+        return bytes(values)
+    except ValueError:
+        return bytes(max(0, min(255, v)) for v in values)
+
+
+def _lerp_channels(prev_values: Sequence[int], steps: Sequence[int], t: float) -> List[int]:
+    """Interpolate channels at eased progress t (0.0-1.0) from prev_values
+    by steps (next value - prev value, per channel)
+
+    Same rounding as utils.interpolate_value. t is a float, so round()
+    already returns an int and the int() wrapper is not needed.
+    """
+    return [round(v + step * t) for v, step in zip(prev_values, steps)]
+
 
 class SceneState(Enum):
     """Scene playback state"""
@@ -40,6 +65,15 @@ class MediaPlaybackInfo:
     is_playing: bool = False
 
 
+@dataclass(slots=True)
+class FixtureTrack:
+    """Keyframes of one fixture in columnar form, sorted by time"""
+    times: List[float]          # Keyframe times in seconds
+    values: List[bytes]         # Channel values of each keyframe
+    starts: List[bytes]         # values[i] zero-padded to the width of interval i
+    steps: List[List[int]]      # values[i + 1] - values[i] over that width, per channel
+
+
 class ScenePlayer:
     """Synchronized playback of a single scene
 
@@ -53,18 +87,38 @@ class ScenePlayer:
     DMX_FPS = 40
     DMX_INTERVAL = 1.0 / DMX_FPS
 
+    # The position callback fires at most once per POSITION_CALLBACK_MS of
+    # scene time (20Hz), when the position enters a new bucket
+    POSITION_CALLBACK_MS = 50
+
     def __init__(self, project: Project, scene: Scene):
         self.project = project
         self.scene = scene
 
         self._state = SceneState.IDLE
-        self._start_time: Optional[float] = None
-        self._pause_time: Optional[float] = None
-        self._elapsed_paused: float = 0.0
+        # Clock: while running, elapsed = monotonic() - _time_base; while
+        # paused or stopped, _time_base is None and _frozen_elapsed_s holds it
+        self._time_base: Optional[float] = None
+        self._frozen_elapsed_s: float = 0.0
+
+        # Scene settings read by the sync loop (refreshed by load())
+        self._loop_enabled = False
+        self._duration_ms = 0
+        self._snapshot_scene_settings()
 
         # Media info
         self._media_list: List[Dict[str, Any]] = []
         self._dmx_sequence: Optional[DMXSequence] = None
+        self._fixture_tracks: List[FixtureTrack] = []
+        self._seq_speed = 1.0
+        self._seq_loop_duration = 0.0  # Wrap period in seconds, 0 when not looping
+        self._seq_easing: Optional[Callable[[float], float]] = None  # None for linear
+
+        # Reused output buffer for interpolated fixture values
+        self._dmx_out = bytearray(512)
+        self._dmx_out_view = memoryview(self._dmx_out)
+        self._last_dmx_frame: Optional[bytes] = None  # Last frame sent to the DMX player
+        self._last_dmx_write = 0  # DMX player write_count expected after that frame
 
         # Players (injected externally)
         self._video_player = None
@@ -76,9 +130,10 @@ class ScenePlayer:
         self._dmx_recording_link: Optional["SceneRecordingLink"] = None
         self._recordings_path: Optional[Path] = None
 
-        # Sync thread
+        # Sync thread (woken early by _stop_event when stopping)
         self._running = False
         self._sync_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
 
         # Callbacks
         self._on_state_change: Optional[Callable[[SceneState], None]] = None
@@ -88,6 +143,9 @@ class ScenePlayer:
 
         # Stats
         self._loop_count = 0
+        self._position_ms = 0  # Last position published by the sync loop
+        self._last_pos_bucket = -1  # POSITION_CALLBACK_MS bucket last reported
+        self._late_ticks = 0  # Sync ticks that overran their slot
 
     def set_video_player(self, player):
         """Inject video player"""
@@ -107,53 +165,24 @@ class ScenePlayer:
         self._set_state(SceneState.LOADING)
 
         try:
+            self._snapshot_scene_settings()
+
             # Get media for this scene
             self._media_list = self.project.get_scene_media(self.scene)
             logger.info(f"Scene '{self.scene.name}': {len(self._media_list)} media elements")
 
-            # Get DMX sequence for this scene
-            self._dmx_sequence = self.project.get_scene_dmx_sequence(self.scene)
-            if self._dmx_sequence:
-                logger.info(f"Scene '{self.scene.name}': DMX sequence '{self._dmx_sequence.name}'")
-
-            # Check for linked DMX recording
-            self._dmx_recording = None
-            self._dmx_recording_link = None
-            if self._dmx_link_manager and self._recordings_path:
-                link = self._dmx_link_manager.get_link(self.scene.id)
-                if link and link.enabled:
-                    self._dmx_recording_link = link
-                    # Load the recording
-                    recording_path = self._recordings_path / f"{link.recording_name}.dmxr"
-                    if recording_path.exists():
-                        from .dmx_recorder import DMXRecording
-                        self._dmx_recording = DMXRecording.load(recording_path)
-                        if self._dmx_recording:
-                            logger.info(f"Scene '{self.scene.name}': DMX recording '{link.recording_name}' loaded (mode: {link.mode})")
-                        else:
-                            logger.warning(f"Failed to load DMX recording: {recording_path}")
-                    else:
-                        logger.warning(f"DMX recording file not found: {recording_path}")
-
-            # Load video into player
+            # Load the video on a worker thread (mpv setup blocks) while
+            # the DMX data is prepared here
+            video_future = None
             video_media = self._get_primary_video()
             if video_media and self._video_player:
-                video_path = video_media['file_path']
-                if isinstance(video_path, str):
-                    video_path = Path(video_path)
-
-                if video_path.exists():
-                    # Get video mapping for this scene (scene-specific or global)
-                    # Pass the VideoMappingConfig directly - the player handles both formats
-                    mapping = self.project.get_scene_mapping(self.scene.id)
+                video_future = _LOAD_POOL.submit(self._load_video, video_media['file_path'])
 
-                    if mapping and mapping.enabled:
-                        logger.info(f"Video mapping enabled: mode={mapping.mode}, deformed={mapping.is_deformed()}")
-
-                    self._video_player.load(video_path, mapping)
-                    logger.info(f"Video loaded: {video_path}")
-                else:
-                    logger.warning(f"Video file not found: {video_path}")
+            try:
+                self._load_dmx()
+            finally:
+                if video_future:
+                    video_future.result()
 
             self._set_state(SceneState.IDLE)
             return True
@@ -163,6 +192,99 @@ class ScenePlayer:
             self._set_state(SceneState.ERROR)
             return False
 
+    def _load_dmx(self):
+        """Prepare the scene DMX sequence and linked recording"""
+        # Get DMX sequence for this scene
+        self._dmx_sequence = self.project.get_scene_dmx_sequence(self.scene)
+        self._prepare_dmx_sequence()
+        if self._dmx_sequence:
+            logger.info(f"Scene '{self.scene.name}': DMX sequence '{self._dmx_sequence.name}'")
+
+        # Check for linked DMX recording
+        self._dmx_recording = None
+        self._dmx_recording_link = None
+        if self._dmx_link_manager and self._recordings_path:
+            link = self._dmx_link_manager.get_link(self.scene.id)
+            if link and link.enabled:
+                self._dmx_recording_link = link
+                # Load the recording
+                recording_path = self._recordings_path / f"{link.recording_name}.dmxr"
+                if recording_path.exists():
+                    from .dmx_recorder import DMXRecording
+                    self._dmx_recording = DMXRecording.load(recording_path)
+                    if self._dmx_recording:
+                        logger.info(f"Scene '{self.scene.name}': DMX recording '{link.recording_name}' loaded (mode: {link.mode})")
+                    else:
+                        logger.warning(f"Failed to load DMX recording: {recording_path}")
+                else:
+                    logger.warning(f"DMX recording file not found: {recording_path}")
+
+    def _load_video(self, video_path: Path):
+        """Load the primary video into the video player (runs on _LOAD_POOL)"""
+        # Get video mapping for this scene (scene-specific or global)
+        # Pass the VideoMappingConfig directly - the player handles both formats
+        mapping = self.project.get_scene_mapping(self.scene.id)
+
+        # The video player checks the file itself, no separate stat here
+        try:
+            self._video_player.load(video_path, mapping)
+        except MediaNotFoundError:
+            logger.warning(f"Video file not found: {video_path}")
+            return
+
+        if mapping and mapping.enabled:
+            logger.info(f"Video mapping enabled: mode={mapping.mode}, deformed={mapping.is_deformed()}")
+        logger.info(f"Video loaded: {video_path}")
+
+    def _snapshot_scene_settings(self):
+        """Copy the scene loop flag and duration into plain attributes for the sync loop
+
+        Refreshed on load, play and seek, so a loop override set on the
+        scene after load (FlowPlayer.play) is picked up.
+        """
+        self._loop_enabled = bool(self.scene.settings.get('loop', False))
+        self._duration_ms = self.scene.duration_ms
+
+    def _prepare_dmx_sequence(self):
+        """Build one time-sorted FixtureTrack per fixture of the DMX sequence
+        and snapshot its timing
+
+        Done once per load: the sequence does not change during playback.
+        """
+        seq = self._dmx_sequence
+        self._seq_speed = seq.speed if seq else 1.0
+        self._seq_loop_duration = seq.duration if seq and seq.loop and seq.duration > 0 else 0.0
+        self._seq_easing = easing_curve(seq.interpolation) if seq else None
+
+        fixture_keyframes: Dict[str, List[Dict]] = {}
+        if seq:
+            for kf in seq.keyframes:
+                fixture_keyframes.setdefault(kf.get('fixtureId', 'default'), []).append(kf)
+
+        for keyframes in fixture_keyframes.values():
+            keyframes.sort(key=lambda x: x.get('time', 0))
+
+        self._fixture_tracks = []
+        for keyframes in fixture_keyframes.values():
+            # Rows are stored as bytes, clamped to 0-255 and cut to the 512
+            # DMX channels. Each interval between two keyframes covers the
+            # wider of the two rows; a channel missing from the shorter row
+            # interpolates from/to 0
+            rows = [_channel_bytes(kf.get('values', [])[:512]) for kf in keyframes]
+            starts = []
+            steps = []
+            for prev, nxt in zip(rows, rows[1:]):
+                width = max(len(prev), len(nxt))
+                prev = prev.ljust(width, b'\x00')
+                starts.append(prev)
+                steps.append([v2 - v1 for v1, v2 in zip(prev, nxt.ljust(width, b'\x00'))])
+            self._fixture_tracks.append(FixtureTrack(
+                times=[kf.get('time', 0) for kf in keyframes],
+                values=rows,
+                starts=starts,
+                steps=steps,
+            ))
+
     def _get_primary_video(self) -> Optional[Dict[str, Any]]:
         """Get the primary video element (first video with autoplay or first video)"""
         videos = [m for m in self._media_list if m['element_type'] == 'video']
@@ -180,18 +302,22 @@ class ScenePlayer:
         if self._state == SceneState.PLAYING:
             return
 
+        self._snapshot_scene_settings()
+
         if self._state == SceneState.PAUSED:
             self.resume()
             return
 
         self._loop_count = 0
-        self._start_time = time.time()
-        self._elapsed_paused = 0.0
+        self._time_base = time.monotonic()
+        self._frozen_elapsed_s = 0.0
+        self._last_pos_bucket = -1
+        self._last_dmx_frame = None
+        self._late_ticks = 0
 
         # Start video
         if self._video_player:
-            loop = self.scene.settings.get('loop', False)
-            self._video_player.play(loop=loop)
+            self._video_player.play(loop=self._loop_enabled)
 
         # Start sync thread
         self._start_sync_thread()
@@ -210,10 +336,10 @@ class ScenePlayer:
         # DMX blackout
         if self._dmx_player:
             self._dmx_player.blackout()
+        self._last_dmx_frame = None
 
-        self._start_time = None
-        self._pause_time = None
-        self._elapsed_paused = 0.0
+        self._time_base = None
+        self._frozen_elapsed_s = 0.0
 
         self._set_state(SceneState.STOPPED)
         logger.info(f"Scene '{self.scene.name}' playback stopped")
@@ -223,7 +349,8 @@ class ScenePlayer:
         if self._state != SceneState.PLAYING:
             return
 
-        self._pause_time = time.time()
+        self._frozen_elapsed_s = time.monotonic() - self._time_base
+        self._time_base = None
 
         if self._video_player:
             self._video_player.pause()
@@ -236,9 +363,7 @@ class ScenePlayer:
         if self._state != SceneState.PAUSED:
             return
 
-        if self._pause_time:
-            self._elapsed_paused += time.time() - self._pause_time
-        self._pause_time = None
+        self._time_base = time.monotonic() - self._frozen_elapsed_s
 
         if self._video_player:
             self._video_player.resume()
@@ -248,27 +373,23 @@ class ScenePlayer:
 
     def seek(self, position_ms: int):
         """Seek to position in milliseconds"""
+        self._snapshot_scene_settings()
+
         if self._video_player:
             self._video_player.seek(position_ms / 1000.0)
 
-        # Adjust start time to match seek position
-        if self._start_time:
-            elapsed_before = self.get_elapsed_ms()
-            offset = position_ms - elapsed_before
-            self._start_time -= offset / 1000.0
+        # Move the clock to the seek position (ignored when not started)
+        if self._time_base is not None:
+            self._time_base = time.monotonic() - position_ms / 1000.0
+        elif self._state == SceneState.PAUSED:
+            self._frozen_elapsed_s = position_ms / 1000.0
 
     def get_elapsed_ms(self) -> int:
         """Get elapsed time in milliseconds"""
-        if not self._start_time:
-            return 0
-
-        if self._pause_time:
-            # If paused, calculate up to pause time
-            elapsed = (self._pause_time - self._start_time - self._elapsed_paused) * 1000
-        else:
-            elapsed = (time.time() - self._start_time - self._elapsed_paused) * 1000
-
-        return int(elapsed)
+        time_base = self._time_base
+        if time_base is None:
+            return int(self._frozen_elapsed_s * 1000)
+        return int((time.monotonic() - time_base) * 1000)
 
     def get_duration_ms(self) -> int:
         """Get scene duration in milliseconds"""
@@ -287,23 +408,32 @@ class ScenePlayer:
             return
 
         self._running = True
+        self._stop_event.clear()
         self._sync_thread = threading.Thread(target=self._sync_loop, daemon=True)
         self._sync_thread.start()
 
     def _stop_sync_thread(self):
         """Stop the sync thread"""
         self._running = False
+        self._stop_event.set()
         if self._sync_thread:
-            self._sync_thread.join(timeout=1.0)
+            # Not when the scene completes from within the sync thread itself
+            if self._sync_thread is not threading.current_thread():
+                self._sync_thread.join(timeout=1.0)
             self._sync_thread = None
 
     def _sync_loop(self):
-        """Main synchronization loop at 40fps"""
-        last_update = time.time()
+        """Main synchronization loop at 40fps
 
-        while self._running:
-            now = time.time()
+        Ticks are scheduled on absolute monotonic deadlines, so time spent
+        in a tick does not push the following ones back. A tick that ends
+        more than a whole interval late drops the missed slots instead of
+        running them back to back.
+        """
+        interval_ns = round(self.DMX_INTERVAL * 1_000_000_000)
+        deadline = time.monotonic_ns()
 
+        while self._running:
             if self._state == SceneState.PLAYING:
                 elapsed_ms = self.get_elapsed_ms()
                 elapsed_sec = elapsed_ms / 1000.0
@@ -312,22 +442,38 @@ class ScenePlayer:
                 if self._dmx_sequence and self._dmx_player:
                     self._update_dmx(elapsed_sec)
 
-                # Notify position update
-                if self._on_position_update:
+                # Publish the position for pollers (position_ms); the
+                # callback only runs when a new POSITION_CALLBACK_MS bucket starts
+                self._position_ms = elapsed_ms
+                bucket = elapsed_ms // self.POSITION_CALLBACK_MS
+                if bucket != self._last_pos_bucket and self._on_position_update:
+                    self._last_pos_bucket = bucket
                     self._on_position_update(elapsed_ms)
 
                 # Check for scene end
-                duration_ms = self.scene.duration_ms
+                duration_ms = self._duration_ms
                 if duration_ms > 0 and elapsed_ms >= duration_ms:
-                    if self.scene.settings.get('loop', False):
+                    if self._loop_enabled:
                         self._handle_loop()
                     else:
                         self._handle_complete()
 
-            # Sleep to maintain ~40fps
-            sleep_time = self.DMX_INTERVAL - (time.time() - now)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            # Wait until the next tick to maintain ~40fps; a stop request
+            # ends the wait immediately
+            deadline += interval_ns
+            now_ns = time.monotonic_ns()
+            sleep_ns = deadline - now_ns
+            if sleep_ns > 0:
+                if self._stop_event.wait(sleep_ns / 1_000_000_000):
+                    break
+                continue
+
+            self._late_ticks += 1
+            if sleep_ns < -interval_ns:
+                missed = -sleep_ns // interval_ns
+                deadline += missed * interval_ns
+                logger.debug(f"Scene '{self.scene.name}' sync loop late, "
+                             f"skipped {missed} tick(s) ({self._late_ticks} late so far)")
 
     def _update_dmx(self, elapsed_sec: float):
         """Update DMX output based on sequence keyframes and/or linked recording"""
@@ -351,95 +497,90 @@ class ScenePlayer:
         if project_channels is None and recording_channels is None:
             return
 
-        # Ensure both have 512 channels
+        # Ensure both have 512 channels (the sequence frame always does)
         if project_channels is None:
-            project_channels = [0] * 512
+            project_channels = bytes(512)
         if recording_channels is None:
-            recording_channels = [0] * 512
-
-        # Pad to 512 if needed
-        project_channels = list(project_channels) + [0] * (512 - len(project_channels))
-        recording_channels = list(recording_channels) + [0] * (512 - len(recording_channels))
+            recording_channels = bytes(512)
+        else:
+            recording_channels = bytes(recording_channels[:512]).ljust(512, b'\x00')
 
         # Blend according to mode
-        from .dmx_scene_link import blend_dmx_frames
-        blended = blend_dmx_frames(project_channels[:512], recording_channels[:512], mode)
+        blended = blend_dmx_frames(project_channels, recording_channels, mode)
 
         # Output blended frame
         if self._dmx_player and blended:
-            self._dmx_player.set_channels(1, blended)
+            self._output_dmx(blended)
 
     def _update_dmx_from_sequence(self, elapsed_sec: float):
         """Update DMX output from project sequence only"""
-        seq = self._dmx_sequence
-        if not seq or not seq.keyframes:
+        # No tracks when there is no sequence or it has no keyframes
+        if not self._fixture_tracks:
             return
 
-        # Apply speed multiplier
-        elapsed_sec *= seq.speed
+        # Speed and loop wrap, computed once for all fixtures
+        seq_time = self._sequence_time(elapsed_sec)
 
-        # Handle sequence loop
-        if seq.loop and seq.duration > 0 and elapsed_sec > seq.duration:
-            elapsed_sec = elapsed_sec % seq.duration
-
-        # Group keyframes by fixture
-        fixture_keyframes: Dict[str, List[Dict]] = {}
-        for kf in seq.keyframes:
-            fixture_id = kf.get('fixtureId', 'default')
-            if fixture_id not in fixture_keyframes:
-                fixture_keyframes[fixture_id] = []
-            fixture_keyframes[fixture_id].append(kf)
-
-        # Sort each fixture's keyframes by time
-        for fixture_id in fixture_keyframes:
-            fixture_keyframes[fixture_id].sort(key=lambda x: x.get('time', 0))
-
-        # Interpolate and output for each fixture
-        for fixture_id, keyframes in fixture_keyframes.items():
-            values = self._interpolate_keyframes(keyframes, elapsed_sec, seq.interpolation)
+        # Interpolate each fixture; later fixtures overwrite the channels
+        # they share with earlier ones, so they are layered into one frame
+        frame = bytearray()
+        for track in self._fixture_tracks:
+            values = self._interpolate_keyframes(track, seq_time)
             if values:
                 # For now, output directly starting at channel 1
                 # TODO: Map fixture to actual DMX channels via fixture config
-                self._dmx_player.set_channels(1, values)
+                frame[:len(values)] = values
+
+        if frame:
+            self._output_dmx(bytes(frame))
+
+    def _sequence_time(self, elapsed_sec: float) -> float:
+        """Position in the DMX sequence for a scene time (speed applied, wrapped when looping)"""
+        seq_time = elapsed_sec * self._seq_speed
+        if self._seq_loop_duration and seq_time > self._seq_loop_duration:
+            seq_time %= self._seq_loop_duration
+        return seq_time
 
     def _update_dmx_from_recording(self, elapsed_sec: float):
         """Update DMX output from linked recording only"""
         channels = self._get_dmx_from_recording(elapsed_sec)
         if channels and self._dmx_player:
-            self._dmx_player.set_channels(1, channels)
+            self._output_dmx(channels)
+
+    def _output_dmx(self, frame: Sequence[int]):
+        """Send a frame starting at channel 1, unless it equals the last frame sent
+
+        The frame is re-sent whenever anything else wrote to the DMX player
+        since (blackout, test channels from the web API), detected through
+        its write_count. Only bytes frames are remembered for the comparison.
+        """
+        player = self._dmx_player
+        if frame == self._last_dmx_frame and player.write_count == self._last_dmx_write:
+            return
+        # Counted before the write: a concurrent write from another thread
+        # then makes the next comparison fail, and the frame is re-sent
+        self._last_dmx_write = player.write_count + 1
+        player.set_channels(1, frame)
+        self._last_dmx_frame = frame if isinstance(frame, bytes) else None
 
-    def _get_dmx_from_sequence(self, elapsed_sec: float) -> Optional[List[int]]:
+    def _get_dmx_from_sequence(self, elapsed_sec: float) -> Optional[bytearray]:
         """Get current DMX values from project sequence"""
-        seq = self._dmx_sequence
-        if not seq or not seq.keyframes:
+        if not self._fixture_tracks:
             return None
 
-        # Apply speed multiplier
-        elapsed_sec *= seq.speed
-
-        # Handle sequence loop
-        if seq.loop and seq.duration > 0 and elapsed_sec > seq.duration:
-            elapsed_sec = elapsed_sec % seq.duration
+        # Speed and loop wrap, computed once for all fixtures
+        seq_time = self._sequence_time(elapsed_sec)
 
         # Get all channels combined from all fixtures
-        all_values = [0] * 512
+        all_values = bytearray(512)
 
-        # Group keyframes by fixture
-        fixture_keyframes: Dict[str, List[Dict]] = {}
-        for kf in seq.keyframes:
-            fixture_id = kf.get('fixtureId', 'default')
-            if fixture_id not in fixture_keyframes:
-                fixture_keyframes[fixture_id] = []
-            fixture_keyframes[fixture_id].append(kf)
-
-        # Sort and interpolate each fixture
-        for fixture_id, keyframes in fixture_keyframes.items():
-            keyframes.sort(key=lambda x: x.get('time', 0))
-            values = self._interpolate_keyframes(keyframes, elapsed_sec, seq.interpolation)
+        # Interpolate each fixture (rows are at most 512 channels wide)
+        for track in self._fixture_tracks:
+            values = self._interpolate_keyframes(track, seq_time)
             if values:
-                # Apply values starting at channel 0
-                for i, v in enumerate(values[:512]):
-                    all_values[i] = max(all_values[i], v)  # HTP for overlapping
+                # Apply values starting at channel 0, HTP for overlapping
+                all_values[:len(values)] = blend_dmx_frames(
+                    all_values, values, DMXPlaybackMode.BLEND.value)
 
         return all_values
 
@@ -460,61 +601,51 @@ class ScenePlayer:
 
     def _interpolate_keyframes(
         self,
-        keyframes: List[Dict],
-        current_time: float,
-        interpolation: str
-    ) -> Optional[List[int]]:
-        """Interpolate between keyframes to get current values"""
-        if not keyframes:
+        track: FixtureTrack,
+        current_time: float
+    ) -> Optional[Sequence[int]]:
+        """Interpolate between keyframes to get current values
+
+        Uses the sequence easing resolved at load (_seq_easing). Returns a
+        keyframe row or a view of the reused _dmx_out buffer, valid until
+        the next call.
+        """
+        times = track.times
+        if not times:
             return None
 
-        # Find surrounding keyframes
-        prev_kf = None
-        next_kf = None
-
-        for kf in keyframes:
-            kf_time = kf.get('time', 0)
-            if kf_time <= current_time:
-                prev_kf = kf
-            elif next_kf is None:
-                next_kf = kf
-                break
+        # Find surrounding keyframes: idx is the first one after current_time
+        idx = bisect_right(times, current_time)
 
-        if prev_kf is None:
+        if idx == 0:
             # Before first keyframe, use first values
-            return keyframes[0].get('values', [])
+            return track.values[0]
 
-        if next_kf is None:
+        if idx == len(times):
             # After last keyframe, use last values
-            return prev_kf.get('values', [])
+            return track.values[-1]
 
         # Interpolate between prev and next
-        prev_time = prev_kf.get('time', 0)
-        next_time = next_kf.get('time', 0)
-        prev_values = prev_kf.get('values', [])
-        next_values = next_kf.get('values', [])
-
+        prev_time = times[idx - 1]
+        next_time = times[idx]
         if next_time == prev_time:
-            return prev_values
-
-        # Calculate progress
-        progress = (current_time - prev_time) / (next_time - prev_time)
+            return track.values[idx - 1]
 
-        # Interpolate each channel
-        result = []
-        max_channels = max(len(prev_values), len(next_values))
-        for i in range(max_channels):
-            v1 = prev_values[i] if i < len(prev_values) else 0
-            v2 = next_values[i] if i < len(next_values) else 0
-            result.append(interpolate_value(v1, v2, progress, interpolation))
+        # Calculate progress, eased once for all channels. prev_time <=
+        # current_time < next_time, so it is already within 0.0-1.0
+        t = (current_time - prev_time) / (next_time - prev_time)
+        if self._seq_easing:
+            t = self._seq_easing(t)
 
-        return result
+        start = track.starts[idx - 1]
+        width = len(start)
+        self._dmx_out[:width] = _lerp_channels(start, track.steps[idx - 1], t)
+        return self._dmx_out_view[:width]
 
     def _handle_loop(self):
         """Handle scene loop"""
         self._loop_count += 1
-        self._start_time = time.time()
-        self._elapsed_paused = 0.0
+        self._time_base = time.monotonic()
 
         # Restart video
         if self._video_player:
@@ -563,6 +694,16 @@ class ScenePlayer:
     def loop_count(self) -> int:
         return self._loop_count
 
+    @property
+    def late_ticks(self) -> int:
+        """Sync ticks that overran their slot since playback started"""
+        return self._late_ticks
+
+    @property
+    def position_ms(self) -> int:
+        """Position as of the last sync tick (cheap to poll from other threads)"""
+        return self._position_ms
+
     @property
     def is_playing(self) -> bool:
         return self._state == SceneState.PLAYING
@@ -1,18 +1,49 @@
 """Utility functions for Flow Player"""
 
 import os
+import json
 import socket
 import logging
 import hashlib
 import subprocess
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union, Callable
 from datetime import datetime
 
 import psutil
 
+try:
+    import orjson
+except ImportError:  # Optional, falls back to the stdlib json module
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Shared stdlib encoders (used when orjson is not installed). ensure_ascii=False
+# emits UTF-8 directly, like orjson, instead of \uXXXX escapes.
+_json_encode = json.JSONEncoder(ensure_ascii=False).encode
+_json_encode_indent = json.JSONEncoder(ensure_ascii=False, indent=2).encode
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 encoded JSON, using orjson when available
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with 2-space indentation
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    encode = _json_encode_indent if indent else _json_encode
+    return encode(obj).encode('utf-8')
+
 
 def get_device_id() -> str:
     """Get unique device ID based on Raspberry Pi serial number or MAC address"""
@@ -196,29 +227,60 @@ def interpolate_value(start: int, end: int, progress: float, easing: str = "line
     Returns:
         Interpolated value
     """
-    import math
+    t = ease_progress(progress, easing)
+
+    # Interpolate
+    value = start + (end - start) * t
+    return int(round(value))
+
+
+def ease_progress(progress: float, easing: str = "linear") -> float:
+    """Apply an easing curve to a progress value
+
+    Args:
+        progress: Progress from 0.0 to 1.0 (clamped)
+        easing: Easing type (linear, ease-in, ease-out, ease-in-out)
 
+    Returns:
+        Eased progress from 0.0 to 1.0
+    """
     # Clamp progress
     progress = max(0.0, min(1.0, progress))
 
     # Apply easing
-    if easing == "linear":
-        t = progress
-    elif easing == "ease-in":
-        t = progress * progress
-    elif easing == "ease-out":
-        t = 1 - (1 - progress) * (1 - progress)
-    elif easing == "ease-in-out":
-        if progress < 0.5:
-            t = 2 * progress * progress
-        else:
-            t = 1 - pow(-2 * progress + 2, 2) / 2
-    else:
-        t = progress
+    curve = _EASING_CURVES.get(easing)
+    return curve(progress) if curve else progress
 
-    # Interpolate
-    value = start + (end - start) * t
-    return int(round(value))
+
+def easing_curve(easing: str) -> Optional[Callable[[float], float]]:
+    """Curve function used by ease_progress for an easing name
+
+    Lets callers resolve the easing once instead of per value. The curve
+    expects progress already clamped to 0.0-1.0. Returns None for linear
+    (and unknown names, which ease_progress treats as linear).
+    """
+    return _EASING_CURVES.get(easing)
+
+
+def _ease_in(progress: float) -> float:
+    return progress * progress
+
+
+def _ease_out(progress: float) -> float:
+    return 1 - (1 - progress) * (1 - progress)
+
+
+def _ease_in_out(progress: float) -> float:
+    if progress < 0.5:
+        return 2 * progress * progress
+    return 1 - pow(-2 * progress + 2, 2) / 2
+
+
+_EASING_CURVES: Dict[str, Callable[[float], float]] = {
+    "ease-in": _ease_in,
+    "ease-out": _ease_out,
+    "ease-in-out": _ease_in_out,
+}
 
 
 def interpolate_dmx_frame(
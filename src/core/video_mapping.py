@@ -144,10 +144,12 @@ class MeshGridData:
     def is_deformed(self) -> bool:
         """Check if any point is moved from default position"""
         eps = 0.001
+        # Expected x depends only on the column: compute the row of them once
+        width = max((len(row) for row in self.points), default=0)
+        expected_xs = [c / self.cols if self.cols > 0 else 0 for c in range(width)]
         for r, row in enumerate(self.points):
-            for c, point in enumerate(row):
-                expected_x = c / self.cols if self.cols > 0 else 0
-                expected_y = r / self.rows if self.rows > 0 else 0
+            expected_y = r / self.rows if self.rows > 0 else 0
+            for point, expected_x in zip(row, expected_xs):
                 if abs(point.x - expected_x) > eps or abs(point.y - expected_y) > eps:
                     return True
         return False
@@ -255,29 +257,38 @@ class MeshTriangulator:
         """
         triangles = []
 
+        # Every grid point is shared by up to 6 triangles: resolve each
+        # point and UV coordinate once up front
+        vertices = [
+            [mesh.get_point(r, c).to_tuple() for c in range(mesh.cols + 1)]
+            for r in range(mesh.rows + 1)
+        ]
+        us = [c / mesh.cols for c in range(mesh.cols + 1)]
+        vs = [r / mesh.rows for r in range(mesh.rows + 1)]
+
         for r in range(mesh.rows):
+            top, bottom = vertices[r], vertices[r + 1]
+            v0, v1 = vs[r], vs[r + 1]
             for c in range(mesh.cols):
                 # Get 4 corners of the cell
-                p00 = mesh.get_point(r, c)
-                p10 = mesh.get_point(r, c + 1)
-                p01 = mesh.get_point(r + 1, c)
-                p11 = mesh.get_point(r + 1, c + 1)
+                p00 = top[c]
+                p10 = top[c + 1]
+                p01 = bottom[c]
+                p11 = bottom[c + 1]
 
-                # Calculate UV coordinates (normalized to cell)
-                u0 = c / mesh.cols
-                u1 = (c + 1) / mesh.cols
-                v0 = r / mesh.rows
-                v1 = (r + 1) / mesh.rows
+                # UV coordinates (normalized to cell)
+                u0 = us[c]
+                u1 = us[c + 1]
 
                 # Triangle 1: p00 -> p01 -> p10
                 triangles.append({
-                    'vertices': [p00.to_tuple(), p01.to_tuple(), p10.to_tuple()],
+                    'vertices': [p00, p01, p10],
                     'uvs': [(u0, v0), (u0, v1), (u1, v0)],
                 })
 
                 # Triangle 2: p10 -> p01 -> p11
                 triangles.append({
-                    'vertices': [p10.to_tuple(), p01.to_tuple(), p11.to_tuple()],
+                    'vertices': [p10, p01, p11],
                     'uvs': [(u1, v0), (u0, v1), (u1, v1)],
                 })
 
@@ -568,4 +568,7 @@ class FlowPlayer:
         if self.dmx_player:
             self.dmx_player.shutdown()
 
+        if self.dmx_link_manager:
+            self.dmx_link_manager.flush()
+
         logger.info("Flow Player shutdown complete")
@@ -2,9 +2,10 @@
 
 import time
 import logging
+import itertools
 import threading
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from dataclasses import dataclass
 
 from ..core.config import DMXConfig
@@ -274,6 +275,11 @@ class DMXPlayer:
         # Current DMX state (512 channels)
         self._dmx_data = bytearray(DMX_CHANNELS)
 
+        # Sequence number of the last write to _dmx_data (see write_count);
+        # next() on itertools.count is atomic, unlike += on an attribute
+        self._write_seq = itertools.count(1)
+        self._write_count = 0
+
         # Sequence data
         self._sequences: List[Dict] = []
         self._current_time = 0.0
@@ -444,6 +450,7 @@ class DMXPlayer:
             for i, value in enumerate(values):
                 if start_channel + i < DMX_CHANNELS:
                     self._dmx_data[start_channel + i] = max(0, min(255, value))
+            self._write_count = next(self._write_seq)
 
     def set_channel(self, channel: int, value: int):
         """Set a single DMX channel value
@@ -454,26 +461,52 @@ class DMXPlayer:
         """
         if 1 <= channel <= DMX_CHANNELS:
             self._dmx_data[channel - 1] = max(DMX_MIN_VALUE, min(DMX_MAX_VALUE, value))
+            self._write_count = next(self._write_seq)
 
-    def set_channels(self, start_channel: int, values: List[int]):
+    def set_channels(self, start_channel: int, values: Union[List[int], bytes, memoryview]):
         """Set multiple consecutive DMX channel values
 
+        The values are written with a single slice assignment, so the
+        output thread never sends a partially updated frame.
+
         Args:
             start_channel: Starting channel number (1-512)
-            values: List of values (0-255)
+            values: List of values (0-255, clamped) or a bytes-like object
         """
-        for i, value in enumerate(values):
-            self.set_channel(start_channel + i, value)
+        # Values for channels outside 1-512 are dropped
+        skip = max(0, 1 - start_channel)
+        start = start_channel - 1 + skip
+        count = min(len(values) - skip, DMX_CHANNELS - start)
+        if count <= 0:
+            return
+
+        chunk = values[skip:skip + count]
+        if not isinstance(chunk, (bytes, bytearray, memoryview)):
+            try:
+                chunk = bytes(chunk)
+            except ValueError:
+                chunk = bytes(max(DMX_MIN_VALUE, min(DMX_MAX_VALUE, v)) for v in chunk)
+        self._dmx_data[start:start + count] = chunk
+        self._write_count = next(self._write_seq)
 
     def blackout(self):
         """Set all channels to 0"""
         self._dmx_data = bytearray(DMX_CHANNELS)
+        self._write_count = next(self._write_seq)
         logger.info("DMX blackout")
 
     def get_dmx_data(self) -> bytes:
         """Get current DMX data"""
         return bytes(self._dmx_data)
 
+    @property
+    def write_count(self) -> int:
+        """Increases with every change to the DMX data (channel sets, blackout)
+
+        Lets a writer tell whether anything else wrote since its last frame.
+        """
+        return self._write_count
+
     def get_position(self) -> float:
         """Get current playback position in seconds"""
         return self._current_time
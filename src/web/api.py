@@ -1058,11 +1058,11 @@ def create_api_blueprint() -> Blueprint:
             result = {
                 "name": recording.name,
                 "duration_ms": recording.duration_ms,
-                "frame_count": len(recording.frames),
+                "frame_count": recording.frame_count,
                 "saved": False
             }
 
-            if save and len(recording.frames) > 0:
+            if save and recording.frame_count > 0:
                 if not filename:
                     # Generate filename from name
                     safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in recording.name)
@@ -1117,9 +1117,9 @@ def create_api_blueprint() -> Blueprint:
             if not path.exists():
                 return api_response(False, error="Recording not found", status_code=404)
 
-            recording = DMXRecording.load(path)
-            if recording:
-                return jsonify(recording.to_info_dict())
+            info = DMXRecording.load_info(path)
+            if info:
+                return jsonify(info)
             else:
                 return api_response(False, error="Failed to load recording", status_code=500)
         except Exception as e: